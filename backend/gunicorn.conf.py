@@ -0,0 +1,20 @@
+import os
+
+# Flask-SocketIO needs one worker per process (sticky sessions); scale out with more
+# containers behind the load balancer, the Redis message queue fans events out between them.
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+worker_class = "gevent"
+workers = 1
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+accesslog = "-"
+errorlog = "-"
+
+os.environ.setdefault("SOCKETIO_ASYNC_MODE", "gevent")
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension that blocks the event loop on every query unless it waits through gevent.
+    from psycogreen.gevent import patch_psycopg
+
+    patch_psycopg()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+import argparse
+from functools import wraps
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import jsonify
+from flask_jwt_extended import create_access_token, get_jwt, jwt_required, verify_jwt_in_request
+
+from src.factory import create_app
+from src.settings import AppConfig
+from src.access_control.decorators import require_roles
+
+
+class BenchmarkConfig(AppConfig):
+    SQLALCHEMY_DATABASE_URI = os.getenv("BENCHMARK_DATABASE_URL", "sqlite:///:memory:")
+    TESTING = True
+
+
+def legacy_require_roles(roles: list[str]):
+    """The previous decorator, which verified and decoded the token a second time."""
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            if get_jwt().get("role") not in roles:
+                return jsonify({"message": "forbidden"}), 403
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+
+def view():
+    return "ok"
+
+
+def timed(app, fn, token: str, repeat: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        with app.test_request_context(headers=headers):
+            assert fn() == "ok"
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare role checks with and without re-decoding the JWT")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    app = create_app(BenchmarkConfig())
+
+    with app.app_context():
+        token = create_access_token(identity="benchmark-user", additional_claims={"role": "manager"})
+
+    print(f"📊 Authorization overhead per request ({args.repeat} runs)")
+    print("-" * 60)
+    for name, fn in [
+        ("jwt_required only", jwt_required()(view)),
+        ("jwt_required + legacy require_roles", jwt_required()(legacy_require_roles(["manager"])(view))),
+        ("jwt_required + require_roles", jwt_required()(require_roles(["manager"])(view))),
+    ]:
+        print(f"  {name:<40} {timed(app, fn, token, args.repeat):8.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
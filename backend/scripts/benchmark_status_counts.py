@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.factory import create_app
+from src.settings import AppConfig
+from src.extensions import db
+from src.project.models import Project
+from src.task.models import Task, TaskStatus
+from src.task.repository import TaskRepository
+from src.task.stats import ProjectTaskStatsRepository
+
+
+class BenchmarkConfig(AppConfig):
+    SQLALCHEMY_DATABASE_URI = os.getenv("BENCHMARK_DATABASE_URL", "sqlite:///:memory:")
+    TESTING = True
+
+
+def scan_completed(project_id: str) -> bool:
+    tasks = TaskRepository.list_for_project(project_id)
+    return bool(tasks) and all(t.status == TaskStatus.DONE for t in tasks)
+
+
+def aggregate_completed(project_id: str) -> bool:
+    return TaskRepository.status_counts(project_id).is_completed
+
+
+def counters_completed(project_id: str) -> bool:
+    return ProjectTaskStatsRepository.get(project_id).is_completed
+
+
+def timed(fn, project_id: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(project_id)
+        db.session.expire_all()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare project completion checks")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app(BenchmarkConfig())
+
+    with app.app_context():
+        db.create_all()
+        project = Project(name="Benchmark", description="Completion check benchmark")
+        db.session.add(project)
+        db.session.commit()
+
+        db.session.add_all(
+            Task(title=f"Task {i}", description="-", project_id=project.id, status=TaskStatus.DONE)
+            for i in range(args.tasks)
+        )
+        db.session.commit()
+
+        print(f"📊 Completion check over {args.tasks} tasks ({args.repeat} runs)")
+        print("-" * 60)
+        for name, fn in [
+            ("ORM scan (list_for_project + all())", scan_completed),
+            ("Aggregate (status_counts)", aggregate_completed),
+            ("Counters (project_task_stats)", counters_completed),
+        ]:
+            assert fn(project.id)
+            print(f"  {name:<40} {timed(fn, project.id, args.repeat):8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.factory import create_app
+from src.extensions import db
+from src.log.partitions import LogPartitions
+from src.log.repository import LogRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partition, roll up and expire audit logs")
+    parser.add_argument("--rollup-days", type=int, default=2, help="Roll up this many days before today")
+    args = parser.parse_args()
+
+    print("🧹 Maintaining audit logs...")
+    print("-" * 60)
+
+    app = create_app()
+
+    with app.app_context():
+        try:
+            created = LogPartitions.ensure(months_ahead=app.config["LOG_PARTITION_MONTHS_AHEAD"])
+            if created:
+                print(f"  ✅ Partitions ready: {', '.join(created)}")
+            else:
+                print("  ℹ️  logs table is not partitioned, using row deletes")
+
+            if app.config["LOG_ROLLUP_ENABLED"]:
+                today = date.today()
+                for offset in range(args.rollup_days, 0, -1):
+                    day = today - timedelta(days=offset)
+                    actions = LogRepository.rollup_daily_counts(day)
+                    print(f"  ✅ Rolled up {day.isoformat()} ({actions} actions)")
+
+            dropped = LogPartitions.drop_expired(app.config["LOG_RETENTION_MONTHS"])
+            print(f"  ✅ Dropped {dropped} expired partitions (retention: {app.config['LOG_RETENTION_MONTHS']} months)")
+
+            print("-" * 60)
+            print("✅ Audit log maintenance completed successfully!")
+
+        except Exception as e:
+            print(f"\n❌ Error maintaining audit logs: {e}")
+            db.session.rollback()
+            raise
+
+
+if __name__ == '__main__':
+    main()
@@ -3,16 +3,40 @@ from flask import jsonify
 from flask_jwt_extended import verify_jwt_in_request, get_jwt
 
 
-def require_roles(roles: list[str]):
+def current_claims() -> dict:
+    """Claims already verified by `@jwt_required()` for this request; the token is only decoded when it was not."""
+    try:
+        return get_jwt()
+    except RuntimeError:
+        verify_jwt_in_request()
+        return get_jwt()
+
+
+def authorize(roles: list[str] | None = None, project_arg: str | None = None, bypass_roles: tuple[str, ...] = ("admin",)):
+    """Single authorization gate: role check and, with `project_arg`, owner/member access to that project.
+
+    Reuses the claims already verified by `@jwt_required()` instead of decoding the token again.
+    """
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
-            verify_jwt_in_request()
-            claims = get_jwt()
-            if claims.get("role") not in roles:
+            claims = current_claims()
+            role = claims.get("role")
+            if roles is not None and role not in roles:
                 return jsonify({"message": "forbidden"}), 403
+            if project_arg and role not in bypass_roles:
+                from ..project.service import ProjectService
+                is_member = ProjectService.is_member(kwargs[project_arg], str(claims["sub"]))
+                if is_member is None:
+                    return jsonify({"message": "Not found"}), 404
+                if not is_member:
+                    return jsonify({"message": "forbidden"}), 403
             return fn(*args, **kwargs)
 
         return decorator
 
     return wrapper
+
+
+def require_roles(roles: list[str]):
+    return authorize(roles=roles)
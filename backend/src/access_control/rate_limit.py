@@ -0,0 +1,43 @@
+import hashlib
+from functools import wraps
+from typing import Callable
+from flask import current_app, request
+from ..cache import cache
+from ..http_responses.responses import too_many_requests
+from ..log.service import LogService
+
+
+def client_ip() -> str:
+    return request.remote_addr or "unknown"
+
+
+def json_field(name: str) -> Callable[[], str | None]:
+    def key() -> str | None:
+        value = (request.get_json(silent=True) or {}).get(name)
+        return str(value).strip().lower() if value else None
+
+    return key
+
+
+def rate_limit(scope: str, key: Callable[[], str | None], limit_setting: str, window_setting: str = "RATE_LIMIT_WINDOW_SECONDS"):
+    """Reject with 429 once `key()` has made more than the configured number of requests in the sliding window.
+
+    Runs before the view, so rejected requests never reach the database. Fails open when Redis is unavailable.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            limit = current_app.config.get(limit_setting, 0)
+            identity = key()
+            if limit > 0 and identity:
+                window = current_app.config.get(window_setting, 60)
+                digest = hashlib.sha1(identity.encode()).hexdigest()
+                hits = cache.hit(f"ratelimit:{scope}:{digest}", window)
+                if hits is not None and hits > limit:
+                    LogService.log_warning("Rate limit exceeded", context={"scope": scope, "hits": hits, "limit": limit})
+                    return too_many_requests(retry_after=window)
+            return fn(*args, **kwargs)
+
+        return decorator
+
+    return wrapper
@@ -0,0 +1,105 @@
+import hashlib
+import math
+import threading
+import time
+from flask_jwt_extended import decode_token
+from ..cache import cache
+from ..extensions import jwt
+
+
+REVOKED_TOKENS_KEY = "auth:revoked"
+
+
+def user_tokens_key(user_id: str) -> str:
+    return f"auth:tokens:{user_id}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings: membership may be a false positive, never a false negative."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        # Double hashing: k positions from two 64-bit halves of one digest.
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenBlocklist:
+    """Revoked JWT ids in Redis, fronted by an in-process Bloom filter so a token that was never revoked costs no round trip.
+
+    The filter is rebuilt from Redis at most every `refresh_interval` seconds, so a token revoked by another
+    process can still be accepted for up to that long. Revocations made in this process apply immediately.
+    """
+
+    def __init__(self) -> None:
+        self.capacity = 100_000
+        self.error_rate = 0.001
+        self.refresh_interval = 5.0
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._refreshed_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.capacity = app.config.get("TOKEN_BLOCKLIST_BLOOM_CAPACITY", 100_000)
+        self.error_rate = app.config.get("TOKEN_BLOCKLIST_BLOOM_ERROR_RATE", 0.001)
+        self.refresh_interval = app.config.get("TOKEN_BLOCKLIST_REFRESH_SECONDS", 5.0)
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._refreshed_at = float("-inf")
+        jwt.token_in_blocklist_loader(lambda jwt_header, jwt_payload: self.is_revoked(jwt_payload["jti"]))
+
+    def is_revoked(self, jti: str) -> bool:
+        self._refresh_if_stale()
+        if jti not in self._bloom:
+            return False
+        return bool(cache.is_live_member(REVOKED_TOKENS_KEY, jti))
+
+    def track(self, user_id: str, *encoded_tokens: str) -> None:
+        """Remember the tokens issued to a user until they expire, so `revoke_user` can find them."""
+        claims = [decode_token(token) for token in encoded_tokens]
+        cache.add_expiring(user_tokens_key(user_id), {c["jti"]: c["exp"] for c in claims})
+
+    def revoke(self, tokens: dict[str, float]) -> None:
+        """Revoke token ids, each kept on the list until its own expiry (unix time)."""
+        if not tokens:
+            return
+        cache.add_expiring(REVOKED_TOKENS_KEY, tokens)
+        with self._lock:
+            for jti in tokens:
+                self._bloom.add(jti)
+
+    def revoke_user(self, user_id: str) -> None:
+        self.revoke(cache.live_members(user_tokens_key(user_id)) or {})
+        cache.delete(user_tokens_key(user_id))
+
+    def _refresh_if_stale(self) -> None:
+        if time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+        with self._lock:
+            if time.monotonic() - self._refreshed_at < self.refresh_interval:
+                return
+            self._refreshed_at = time.monotonic()
+        revoked = cache.live_members(REVOKED_TOKENS_KEY)
+        if revoked is None:
+            # Redis unreachable: keep answering from the last filter rather than rejecting every request.
+            return
+        bloom = BloomFilter(max(self.capacity, 2 * len(revoked)), self.error_rate)
+        for jti in revoked:
+            bloom.add(jti)
+        with self._lock:
+            self._bloom = bloom
+
+
+token_blocklist = TokenBlocklist()
@@ -2,10 +2,14 @@ from flask import Blueprint, request
 from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from sqlalchemy.exc import IntegrityError
 from ..user.service import UserService
+from ..user.passwords import HasherSaturatedError, password_hasher
+from .blocklist import token_blocklist
 from ..access_control.decorators import require_roles
-from ..http_responses.responses import success, created, unauthorized, conflict
+from ..access_control.rate_limit import rate_limit, client_ip, json_field
+from ..http_responses.responses import success, created, unauthorized, conflict, service_unavailable
 from ..log.service import LogService
 from ..log.models import ActionType
+from ..log.decorator import log_action_to_db
 from ..extensions import db
 
 
@@ -13,6 +17,8 @@ auth_bp = Blueprint("auth", __name__)
 
 
 @auth_bp.post("/login")
+@rate_limit("login:ip", client_ip, "RATE_LIMIT_LOGIN_PER_IP")
+@rate_limit("login:email", json_field("email"), "RATE_LIMIT_LOGIN_PER_EMAIL")
 def login():
     """
     User authentication
@@ -53,16 +59,25 @@ def login():
                       type: string
       401:
         description: Invalid credentials
+      429:
+        description: Too many attempts from this IP or for this email; retry after the Retry-After delay
+      503:
+        description: Password hashing is saturated; retry after the Retry-After delay
     """
     data = request.get_json() or {}
     email = data.get("email")
     password = data.get("password")
-    user = UserService.authenticate(email, password)
+    try:
+        user = UserService.authenticate(email, password)
+    except HasherSaturatedError as e:
+        LogService.log_warning("Login rejected: password hashing saturated", context=password_hasher.stats())
+        return service_unavailable(str(e))
     if not user:
         LogService.log_warning("Login failed: invalid credentials", context={"email": email})
         return unauthorized("Invalid credentials")
     access = create_access_token(identity=str(user.id), additional_claims={"role": user.role.value})
     refresh = create_refresh_token(identity=str(user.id))
+    token_blocklist.track(str(user.id), access, refresh)
     LogService.log_action(action=ActionType.LOGIN, user_id=str(user.id))
     LogService.log_info("User logged in successfully", context={"user_id": str(user.id), "email": email})
     return success(data={"access_token": access, "refresh_token": refresh})
@@ -92,17 +107,21 @@ def refresh():
                     access_token:
                       type: string
       401:
-        description: Invalid or expired token
+        description: Invalid, expired or revoked token
     """
     user_id = get_jwt_identity()
     user = UserService.get_by_id(user_id)
+    if not user:
+        return unauthorized("User no longer exists")
     access = create_access_token(identity=str(user.id), additional_claims={"role": user.role.value})
+    token_blocklist.track(str(user.id), access)
     return success(data={"access_token": access})
 
 
 @auth_bp.post("/register")
 @jwt_required()
 @require_roles(["admin", "manager"])
+@log_action_to_db(transactional=True)
 def register():
     """
     Register new user
@@ -159,6 +178,8 @@ def register():
         description: Not authenticated
       403:
         description: Insufficient permissions (requires Admin or Manager)
+      503:
+        description: Password hashing is saturated; retry after the Retry-After delay
     """
     try:
         data = request.get_json() or {}
@@ -172,6 +193,10 @@ def register():
             LogService.log_error("Failed to create user - email already exists", error=e, context={"email": data.get("email")})
             return conflict("Email already in use")
         raise
+    except HasherSaturatedError as e:
+        db.session.rollback()
+        LogService.log_warning("Registration rejected: password hashing saturated", context=password_hasher.stats())
+        return service_unavailable(str(e))
     except IntegrityError as e:
         db.session.rollback()
         error_msg = str(e).lower()
@@ -191,3 +216,43 @@ def register():
         LogService.log_error(f"Unexpected error creating user: {traceback.format_exc()}", error=e, context={"email": data.get("email")})
         from ..http_responses.responses import internal_server_error
         return internal_server_error("Failed to create user")
+
+
+@auth_bp.get("/hasher/stats")
+@jwt_required()
+@require_roles(["admin"])
+def hasher_stats():
+    """
+    Password hashing pool load
+    ---
+    tags:
+      - Auth
+    security:
+      - bearerAuth: []
+    description: Counters are per worker process and reset on restart. Login and registration answer 503 once in_flight reaches capacity.
+    responses:
+      200:
+        description: Pool size, current depth and rejections
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                enabled:
+                  type: boolean
+                workers:
+                  type: integer
+                in_flight:
+                  type: integer
+                queued:
+                  type: integer
+                capacity:
+                  type: integer
+                rejected:
+                  type: integer
+      401:
+        description: Not authenticated
+      403:
+        description: Admin only
+    """
+    return success(data=password_hasher.stats())
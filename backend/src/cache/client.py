@@ -1,34 +1,427 @@
+import os
+import threading
+import time
+import uuid
+from typing import AbstractSet, Callable, Protocol, TypeVar
 from redis import Redis
+from .local import LocalCache, MISSING
+from .serializers import Serializer, JsonSerializer, get_serializer
+
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+GENERATION_TTL = 24 * 60 * 60
+# Security and rate-limit state is not a cache of anything: bumping CACHE_SCHEMA_VERSION must not reset it.
+UNVERSIONED_NAMESPACES = ("auth:", "ratelimit:")
+
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# KEYS[2] is the set's generation counter: a rebuild that read the database before an invalidation must not land.
+SET_SET_SCRIPT = """
+local generation = redis.call("get", KEYS[2]) or ""
+if ARGV[1] ~= KEYS[2] .. ":" .. generation then
+    return 0
+end
+redis.call("del", KEYS[1])
+for i = 3, #ARGV do
+    redis.call("sadd", KEYS[1], ARGV[i])
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call("expire", KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+# Redis drops empty sets, so every cached set keeps this placeholder member to tell "empty" from "not cached".
+SET_PLACEHOLDER = ""
+
+
+class CacheModel(Protocol):
+    @classmethod
+    def from_dict(cls, data: dict): ...
+
+    def to_dict(self) -> dict: ...
+
+
+M = TypeVar("M", bound=CacheModel)
 
 
 class Cache:
     def __init__(self) -> None:
         self.client: Redis | None = None
+        self.raw_client: Redis | None = None
+        self.serializer: Serializer = JsonSerializer()
+        self.key_prefix = ""
+        self.local: LocalCache | None = None
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self._listener_pid: int | None = None
+        self._listener_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
 
     def init_app(self, app) -> None:
         self.client = Redis.from_url(app.config["REDIS_URL"], decode_responses=True)
+        self.raw_client = Redis.from_url(app.config["REDIS_URL"])
+        self.serializer = get_serializer(app.config.get("CACHE_SERIALIZER", "json"))
+        self.key_prefix = f"v{app.config.get('CACHE_SCHEMA_VERSION', 1)}:"
+        l1_max_size = app.config.get("CACHE_L1_MAX_SIZE", 0)
+        if l1_max_size > 0:
+            self.local = LocalCache(max_size=l1_max_size, ttl=app.config.get("CACHE_L1_TTL", 5.0))
+            self._ensure_listener()
+
+    def _key(self, key: str) -> str:
+        if key.startswith(UNVERSIONED_NAMESPACES):
+            return key
+        return f"{self.key_prefix}{key}"
 
     def get(self, key: str):
         if not self.client:
             return None
+        full_key = self._key(key)
+        local_value = self._get_local(full_key)
+        if local_value is not MISSING:
+            return local_value
         try:
-            return self.client.get(key)
+            value = self.client.get(full_key)
         except Exception:
             return None
+        self._record_l2(full_key, value)
+        return value
 
     def set(self, key: str, value: str, ex: int | None = None):
         if not self.client:
             return None
+        full_key = self._key(key)
         try:
-            return self.client.set(key, value, ex=ex)
+            result = self.client.set(full_key, value, ex=ex)
         except Exception:
             return None
+        if self.local:
+            self.local.set(full_key, value, ttl=ex)
+        return result
 
     def delete(self, key: str):
         if not self.client:
             return None
+        full_key = self._key(key)
+        if self.local:
+            self.local.delete(full_key)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.delete(full_key)
+            self._bump_generation(pipe, full_key)
+            if self.local:
+                pipe.publish(INVALIDATION_CHANNEL, full_key)
+            return pipe.execute()[0]
+        except Exception:
+            return None
+
+    def delete_many(self, keys: list[str]):
+        if not self.client or not keys:
+            return None
+        full_keys = list(dict.fromkeys(self._key(k) for k in keys))
+        if self.local:
+            for full_key in full_keys:
+                self.local.delete(full_key)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.unlink(*full_keys)
+            for full_key in full_keys:
+                self._bump_generation(pipe, full_key)
+            if self.local:
+                for full_key in full_keys:
+                    pipe.publish(INVALIDATION_CHANNEL, full_key)
+            return pipe.execute()[0]
+        except Exception:
+            return None
+
+    def hit(self, key: str, window: float) -> int | None:
+        """Record one hit on a sliding window and return the hits within the last `window` seconds."""
+        if not self.client:
+            return None
+        full_key = self._key(key)
+        now = time.time()
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.zremrangebyscore(full_key, 0, now - window)
+            pipe.zadd(full_key, {f"{now}:{uuid.uuid4().hex[:8]}": now})
+            pipe.zcard(full_key)
+            pipe.expire(full_key, int(window) + 1)
+            return pipe.execute()[2]
+        except Exception:
+            return None
+
+    def get_set(self, key: str) -> AbstractSet[str] | None:
+        if not self.client:
+            return None
+        try:
+            members = self.client.smembers(self._key(key))
+        except Exception:
+            return None
+        if not members:
+            return None
+        return members - {SET_PLACEHOLDER}
+
+    def set_set(self, key: str, members: AbstractSet[str], version: str, ex: int | None = None):
+        """Cache a set only if the key's generation still equals `version`, read before loading `members`."""
+        if not self.client:
+            return None
+        full_key = self._key(key)
+        try:
+            return self.client.eval(
+                SET_SET_SCRIPT, 2, full_key, f"gen:{full_key}", version, ex or 0, SET_PLACEHOLDER, *members
+            )
+        except Exception:
+            return None
+
+    def set_contains(self, key: str, member: str) -> bool | None:
+        """Membership in a cached set, or None when the set is not cached."""
+        if not self.client:
+            return None
+        full_key = self._key(key)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.exists(full_key)
+            pipe.sismember(full_key, member)
+            exists, is_member = pipe.execute()
+        except Exception:
+            return None
+        return bool(is_member) if exists else None
+
+    def add_expiring(self, key: str, members: dict[str, float]):
+        """Add members scored by their expiry (unix time) and drop the ones that already expired."""
+        if not self.client or not members:
+            return None
+        full_key = self._key(key)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.zadd(full_key, members)
+            pipe.zremrangebyscore(full_key, 0, time.time())
+            # The key lives as long as its latest member: NX sets the first expiry, GT only ever extends it (Redis 7).
+            expires_at = int(max(members.values())) + 1
+            pipe.expireat(full_key, expires_at, nx=True)
+            pipe.expireat(full_key, expires_at, gt=True)
+            return pipe.execute()[0]
+        except Exception:
+            return None
+
+    def live_members(self, key: str) -> dict[str, float] | None:
+        """Unexpired members of an `add_expiring` set with their expiry, or None when the cache is unavailable."""
+        if not self.client:
+            return None
+        try:
+            return dict(self.client.zrangebyscore(self._key(key), time.time(), "+inf", withscores=True))
+        except Exception:
+            return None
+
+    def is_live_member(self, key: str, member: str) -> bool | None:
+        if not self.client:
+            return None
+        try:
+            expires_at = self.client.zscore(self._key(key), member)
+        except Exception:
+            return None
+        return expires_at is not None and expires_at > time.time()
+
+    def version(self, key: str) -> str | None:
+        """Current generation of a cached key; it changes every time the key is deleted."""
+        if not self.client:
+            return None
+        generation_key = f"gen:{self._key(key)}"
         try:
-            return self.client.delete(key)
+            pipe = self.client.pipeline(transaction=False)
+            # Seeded from the clock so a flushed or expired counter never repeats a value handed out before.
+            pipe.set(generation_key, time.time_ns(), nx=True, ex=GENERATION_TTL)
+            pipe.get(generation_key)
+            generation = pipe.execute()[1]
         except Exception:
             return None
+        return f"{generation_key}:{generation}"
+
+    @staticmethod
+    def _bump_generation(pipe, full_key: str) -> None:
+        # Seed like version() so a counter lost to a flush or expiry does not restart at 1 and repeat old values.
+        pipe.set(f"gen:{full_key}", time.time_ns(), nx=True, ex=GENERATION_TTL)
+        pipe.incr(f"gen:{full_key}")
+        pipe.expire(f"gen:{full_key}", GENERATION_TTL)
+
+    def stats(self) -> dict:
+        """Per-process hit/miss counters for each tier."""
+        with self._stats_lock:
+            stats = {"l2_hits": self.l2_hits, "l2_misses": self.l2_misses}
+        if self.local:
+            stats.update(l1_hits=self.local.hits, l1_misses=self.local.misses, l1_size=self.local.size)
+        return stats
+
+    def _get_local(self, full_key: str):
+        if not self.local:
+            return MISSING
+        self._ensure_listener()
+        return self.local.get(full_key)
+
+    def _record_l2(self, full_key: str, value) -> None:
+        with self._stats_lock:
+            if value is None:
+                self.l2_misses += 1
+            else:
+                self.l2_hits += 1
+        if value is None:
+            return
+        if self.local:
+            self.local.set(full_key, value)
+
+    def _ensure_listener(self) -> None:
+        # Forked workers do not inherit the parent's subscriber thread, so one is started per process.
+        if self._listener_pid == os.getpid():
+            return
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            threading.Thread(target=self._listen_for_invalidations, name="cache-invalidation", daemon=True).start()
+
+    def _listen_for_invalidations(self) -> None:
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                for message in pubsub.listen():
+                    self.local.delete(message["data"])
+            except Exception:
+                # Invalidations published while disconnected are lost, so drop everything held locally.
+                self.local.clear()
+                time.sleep(1)
+
+    def get_model(self, key: str, model_cls: type[M]) -> M | None:
+        data = self._load(key)
+        if not isinstance(data, dict):
+            return None
+        return model_cls.from_dict(data)
+
+    def set_model(self, key: str, model: CacheModel, ex: int | None = None):
+        return self._dump(key, model.to_dict(), ex)
+
+    def get_models(self, key: str, model_cls: type[M]) -> list[M] | None:
+        data = self._load(key)
+        if not isinstance(data, list):
+            return None
+        return [model_cls.from_dict(item) for item in data]
+
+    def set_models(self, key: str, models: list[CacheModel], ex: int | None = None):
+        return self._dump(key, [m.to_dict() for m in models], ex)
+
+    def _load(self, key: str):
+        if not self.raw_client:
+            return None
+        full_key = self._key(key)
+        local_value = self._get_local(full_key)
+        if local_value is not MISSING:
+            return local_value
+        try:
+            data = self.raw_client.get(full_key)
+            value = self.serializer.loads(data) if data is not None else None
+        except Exception:
+            return None
+        self._record_l2(full_key, value)
+        return value
+
+    def _dump(self, key: str, value, ex: int | None):
+        if not self.raw_client:
+            return None
+        full_key = self._key(key)
+        try:
+            result = self.raw_client.set(full_key, self.serializer.dumps(value), ex=ex)
+        except Exception:
+            return None
+        if self.local:
+            self.local.set(full_key, value, ttl=ex)
+        return result
+
+    def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], str],
+        ex: int | None = None,
+        lock_timeout: float = 5.0,
+        wait_timeout: float = 1.0,
+    ) -> str:
+        return self._read_through(
+            key,
+            lambda: self.get(key),
+            lambda value: self.set(key, value, ex=ex),
+            loader,
+            lock_timeout,
+            wait_timeout,
+        )
+
+    def get_or_set_models(
+        self,
+        key: str,
+        model_cls: type[M],
+        loader: Callable[[], list[M]],
+        ex: int | None = None,
+        lock_timeout: float = 5.0,
+        wait_timeout: float = 1.0,
+    ) -> list[M]:
+        return self._read_through(
+            key,
+            lambda: self.get_models(key, model_cls),
+            lambda models: self.set_models(key, models, ex=ex),
+            loader,
+            lock_timeout,
+            wait_timeout,
+        )
+
+    def _read_through(self, key, read, write, loader, lock_timeout: float, wait_timeout: float):
+        cached = read()
+        if cached is not None:
+            return cached
+
+        lock_key = f"lock:{key}"
+        token = self._acquire_lock(lock_key, lock_timeout)
+        if token is None:
+            # Another worker is rebuilding this key; wait for its value before falling back to the loader.
+            cached = self._wait_for(read, wait_timeout)
+            if cached is not None:
+                return cached
+
+        try:
+            value = loader()
+            write(value)
+            return value
+        finally:
+            if token:
+                self._release_lock(lock_key, token)
+
+    def _acquire_lock(self, lock_key: str, timeout: float) -> str | None:
+        if not self.client:
+            return ""
+        token = str(uuid.uuid4())
+        try:
+            if self.client.set(self._key(lock_key), token, nx=True, px=int(timeout * 1000)):
+                return token
+            return None
+        except Exception:
+            return ""
+
+    def _release_lock(self, lock_key: str, token: str) -> None:
+        if not self.client:
+            return
+        try:
+            self.client.eval(RELEASE_LOCK_SCRIPT, 1, self._key(lock_key), token)
+        except Exception:
+            pass
 
+    def _wait_for(self, read, timeout: float, interval: float = 0.05):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(interval)
+            cached = read()
+            if cached is not None:
+                return cached
+        return None
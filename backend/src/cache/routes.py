@@ -0,0 +1,46 @@
+from flask import Blueprint
+from flask_jwt_extended import jwt_required
+from ..access_control.decorators import require_roles
+from ..http_responses.responses import success
+from . import cache
+
+
+cache_bp = Blueprint("cache", __name__)
+
+
+@cache_bp.get("/stats")
+@jwt_required()
+@require_roles(["admin"])
+def cache_stats():
+    """
+    Cache hit/miss counters
+    ---
+    tags:
+      - Cache
+    security:
+      - bearerAuth: []
+    description: Counters are per worker process and reset on restart. L1 fields appear only when CACHE_L1_MAX_SIZE is set.
+    responses:
+      200:
+        description: Counters per tier
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                l1_hits:
+                  type: integer
+                l1_misses:
+                  type: integer
+                l1_size:
+                  type: integer
+                l2_hits:
+                  type: integer
+                l2_misses:
+                  type: integer
+      401:
+        description: Not authenticated
+      403:
+        description: Admin only
+    """
+    return success(data=cache.stats())
@@ -6,5 +6,5 @@ from flasgger import Swagger
 
 db = SQLAlchemy()
 jwt = JWTManager()
-socketio = SocketIO(async_mode="threading")
+socketio = SocketIO()
 swagger = Swagger()
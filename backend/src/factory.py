@@ -1,11 +1,21 @@
-import logging
-import sys
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 from .settings import AppConfig
 from .extensions import db, jwt, socketio, swagger
 from .cache import cache
+from .task.broadcaster import progress_broadcaster
+from .task.events import register_socket_handlers
 from .log.models import Log
+from .log.writer import audit_log_writer
+from .log.partitions import LogPartitions
+from .log.service import LogService
+from .log.structured import configure_logging
+from .user.passwords import password_hasher
+from .auth.blocklist import token_blocklist
 from .register_blueprints import register_blueprints
+from .versioning import StaleVersionError
+from .http_responses.responses import precondition_failed
+from .request_scope import init_request_scope
 
 
 def create_app(config_object: type[AppConfig] | None = None) -> Flask:
@@ -13,24 +23,32 @@ def create_app(config_object: type[AppConfig] | None = None) -> Flask:
     app.config.from_object(config_object or AppConfig())
     
     app.config['PROPAGATE_EXCEPTIONS'] = True
+
+    proxies = app.config.get("TRUSTED_PROXY_COUNT", 0)
+    if proxies:
+        # Behind a load balancer remote_addr is the balancer; trust only the hops we actually run.
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies, x_proto=proxies, x_host=proxies)
     
-    app_logger = logging.getLogger("app")
-    app_logger.setLevel(logging.INFO)
-    
-    if not app_logger.handlers:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter("%(message)s")
-        console_handler.setFormatter(formatter)
-        app_logger.addHandler(console_handler)
-        app_logger.propagate = False
+    configure_logging(app)
 
     db.init_app(app)
     jwt.init_app(app)
     if not app.config.get("TESTING"):
         cache.init_app(app)
     swagger.init_app(app)
+    progress_broadcaster.init_app(app)
+    audit_log_writer.init_app(app)
+    password_hasher.init_app(app)
+    token_blocklist.init_app(app)
     register_blueprints(app)
+    init_request_scope(app)
+
+    @app.errorhandler(StaleVersionError)
+    def handle_stale_version(e):
+        # Raised by If-Match checks and by any flush that lost an optimistic-locking race, in whichever route.
+        db.session.rollback()
+        LogService.log_warning("Rejected stale write", context={"error": str(e)})
+        return precondition_failed(str(e))
 
     @app.errorhandler(Exception)
     def handle_exception(e):
@@ -53,6 +71,19 @@ def create_app(config_object: type[AppConfig] | None = None) -> Flask:
 
     with app.app_context():
         db.create_all()
+        if not app.config.get("TESTING"):
+            try:
+                LogPartitions.ensure(months_ahead=app.config.get("LOG_PARTITION_MONTHS_AHEAD", 2))
+            except Exception as e:
+                # Missing partitions only route new rows to logs_default; that must not keep the API from booting.
+                db.session.rollback()
+                LogService.log_error("Failed to ensure audit log partitions", error=e)
 
-    socketio.init_app(app, cors_allowed_origins="*")
+    socketio.init_app(
+        app,
+        cors_allowed_origins="*",
+        async_mode=app.config.get("SOCKETIO_ASYNC_MODE", "threading"),
+        message_queue=None if app.config.get("TESTING") else app.config.get("SOCKETIO_MESSAGE_QUEUE") or None,
+    )
+    register_socket_handlers(socketio)
     return app
@@ -1,19 +1,25 @@
+import hashlib
 from enum import IntEnum
-from flask import jsonify, Response
-from typing import Any
+from flask import jsonify, request, Response
+from typing import Any, Callable
+from ..cache import cache
 
 
 class HttpStatus(IntEnum):
     OK = 200
     CREATED = 201
     NO_CONTENT = 204
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
     CONFLICT = 409
+    PRECONDITION_FAILED = 412
     UNPROCESSABLE_ENTITY = 422
+    TOO_MANY_REQUESTS = 429
     INTERNAL_SERVER_ERROR = 500
+    SERVICE_UNAVAILABLE = 503
 
 
 def success(data: Any = None, message: str | None = None) -> tuple[Response, int]:
@@ -32,6 +38,65 @@ def no_content() -> tuple[str, int]:
     return "", HttpStatus.NO_CONTENT
 
 
+def not_modified(etag: str) -> tuple[Response, int]:
+    response = Response(status=HttpStatus.NOT_MODIFIED)
+    response.set_etag(etag)
+    return response, HttpStatus.NOT_MODIFIED
+
+
+def body_etag(response: Response) -> str:
+    return hashlib.sha1(response.get_data()).hexdigest()
+
+
+def version_etag(response: Response) -> str:
+    """The row `version` of a single versioned resource, so the ETag can be sent back as `If-Match`."""
+    return str(response.get_json()["version"])
+
+
+def conditional(
+    key: str,
+    build: Callable[[], tuple[Response, int]],
+    ttl: int = 60,
+    etag_of: Callable[[Response], str] = body_etag,
+) -> tuple[Response, int]:
+    """Serve `build()` with a strong ETag of the body actually sent, answering 304 without `build` when possible.
+
+    The ETag is remembered per URL with the generation of the cache `key` it was built under, so a repeated
+    If-None-Match is answered from that note until the key is invalidated. The note expires after `ttl` like the
+    data caches, so a body that was already stale when built cannot be pinned by 304s beyond that.
+    """
+    version = cache.version(key)
+    note_key = f"etag:{hashlib.sha1(f'{key}|{request.full_path}'.encode()).hexdigest()}"
+    if version is not None:
+        noted_version, _, noted_etag = (cache.get(note_key) or "").rpartition(" ")
+        if noted_version == version and request.if_none_match.contains(noted_etag):
+            return not_modified(noted_etag)
+    response, status = build()
+    if status != HttpStatus.OK:
+        return response, status
+    etag = etag_of(response)
+    # Only vouch for the body under this generation if no write invalidated the key while it was built.
+    if version is not None and cache.version(key) == version:
+        cache.set(note_key, f"{version} {etag}", ex=ttl)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response, status
+
+
+def if_match_version() -> int | None:
+    """Resource version the client edited, from `If-Match: "<version>"`; None when absent or `*`."""
+    if_match = request.if_match
+    if not if_match or if_match.star_tag:
+        return None
+    tags = if_match.as_set()
+    if len(tags) == 1 and (tag := next(iter(tags))).isdigit():
+        return int(tag)
+    # An unparseable precondition never matches.
+    return -1
+
+
 def bad_request(message: str = "Bad request") -> tuple[Response, int]:
     return jsonify({"message": message}), HttpStatus.BAD_REQUEST
 
@@ -52,10 +117,25 @@ def conflict(message: str = "Conflict") -> tuple[Response, int]:
     return jsonify({"message": message}), HttpStatus.CONFLICT
 
 
+def precondition_failed(message: str = "Precondition failed") -> tuple[Response, int]:
+    return jsonify({"message": message}), HttpStatus.PRECONDITION_FAILED
+
+
 def unprocessable_entity(message: str = "Unprocessable entity") -> tuple[Response, int]:
     return jsonify({"message": message}), HttpStatus.UNPROCESSABLE_ENTITY
 
 
+def too_many_requests(message: str = "Too many requests", retry_after: int = 60) -> tuple[Response, int]:
+    response = jsonify({"message": message})
+    response.headers["Retry-After"] = str(retry_after)
+    return response, HttpStatus.TOO_MANY_REQUESTS
+
+
 def internal_server_error(message: str = "Internal server error") -> tuple[Response, int]:
     return jsonify({"message": message}), HttpStatus.INTERNAL_SERVER_ERROR
 
+
+def service_unavailable(message: str = "Service unavailable", retry_after: int = 1) -> tuple[Response, int]:
+    response = jsonify({"message": message})
+    response.headers["Retry-After"] = str(retry_after)
+    return response, HttpStatus.SERVICE_UNAVAILABLE
@@ -2,40 +2,66 @@ from functools import wraps
 from flask_jwt_extended import get_jwt_identity
 from .service import LogService
 from .models import ActionType
+from ..unit_of_work import unit_of_work
 from typing import Optional
 
 
+def _status_code(response) -> int:
+    if isinstance(response, tuple):
+        if len(response) > 1 and isinstance(response[1], int):
+            return response[1]
+        response = response[0]
+    return getattr(response, "status_code", 200)
+
+
 def log_action_to_db(
-    action: ActionType,
+    action: Optional[ActionType] = None,
     resource_type: Optional[str] = None,
-    get_resource_id: Optional[callable] = None
+    get_resource_id: Optional[callable] = None,
+    transactional: bool = False
 ):
+    """With transactional=True, audit rows and business changes made by the route share one commit."""
+    def log(response):
+        if not action:
+            return
+        
+        user_id = None
+        try:
+            user_id = get_jwt_identity()
+        except RuntimeError:
+            pass
+        
+        resource_id = None
+        if get_resource_id:
+            try:
+                resource_id = get_resource_id(response)
+            except Exception:
+                pass
+        
+        LogService.log_action(
+            action=action,
+            user_id=user_id,
+            resource_type=resource_type,
+            resource_id=resource_id
+        )
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
+            if transactional:
+                with unit_of_work() as uow:
+                    response = fn(*args, **kwargs)
+                    if _status_code(response) >= 400:
+                        uow.discard = True
+                    else:
+                        log(response)
+                return response
+            
             try:
                 response = fn(*args, **kwargs)
                 
-                user_id = None
-                try:
-                    user_id = get_jwt_identity()
-                except RuntimeError:
-                    pass
-                
-                resource_id = None
-                if get_resource_id:
-                    try:
-                        resource_id = get_resource_id(response)
-                    except Exception:
-                        pass
-                
                 try:
-                    LogService.log_action(
-                        action=action,
-                        user_id=user_id,
-                        resource_type=resource_type,
-                        resource_id=resource_id
-                    )
+                    log(response)
                 except Exception:
                     pass
                 
@@ -48,4 +74,3 @@ def log_action_to_db(
         
         return wrapper
     return decorator
-
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from .models import ActionType
+
+
+def _parse_datetime(name: str, value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO 8601 datetime")
+    # created_at is stored as naive UTC; convert offsets instead of dropping them.
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass(frozen=True, slots=True)
+class LogFilters:
+    """Audit log query filters; `since` is inclusive and `until` exclusive."""
+
+    action: ActionType | None = None
+    user_id: str | None = None
+    resource_type: str | None = None
+    resource_id: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @classmethod
+    def from_args(cls, args) -> "LogFilters":
+        action = args.get("action")
+        try:
+            action = ActionType(action) if action else None
+        except ValueError:
+            raise ValueError(f"Unknown action: {action}")
+        return cls(
+            action=action,
+            user_id=args.get("user_id") or None,
+            resource_type=args.get("resource_type") or None,
+            resource_id=args.get("resource_id") or None,
+            since=_parse_datetime("since", args.get("since")),
+            until=_parse_datetime("until", args.get("until")),
+        )
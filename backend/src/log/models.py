@@ -1,7 +1,7 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from sqlalchemy import String, DateTime, Enum as SAEnum, Text
+from sqlalchemy import Index, String, DateTime, Date, Integer, Enum as SAEnum, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from ..extensions import db
 
@@ -22,6 +22,15 @@ class ActionType(str, Enum):
 
 class Log(db.Model):
     __tablename__ = "logs"
+    # On Postgres the table is range-partitioned by month (see log.partitions); the partition key must be part of the primary key.
+    # Composite indexes end in (created_at, id) so filtered queries can walk them in keyset order.
+    __table_args__ = (
+        Index("ix_logs_created_at_id", "created_at", "id"),
+        Index("ix_logs_action_created_at_id", "action", "created_at", "id"),
+        Index("ix_logs_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_logs_resource_created_at_id", "resource_type", "resource_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     id: Mapped[str] = mapped_column(
         String(36), 
@@ -30,13 +39,11 @@ class Log(db.Model):
     )
     action: Mapped[ActionType] = mapped_column(
         SAEnum(ActionType), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_id: Mapped[str | None] = mapped_column(
         String(36), 
         nullable=True,
-        index=True,
         comment="ID of the user who performed the action"
     )
     resource_type: Mapped[str | None] = mapped_column(
@@ -56,9 +63,9 @@ class Log(db.Model):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
+        primary_key=True,
         default=datetime.utcnow,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     def to_dict(self) -> dict:
@@ -72,3 +79,14 @@ class Log(db.Model):
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
 
+
+
+class LogDailyCount(db.Model):
+    __tablename__ = "log_daily_counts"
+    
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    action: Mapped[ActionType] = mapped_column(SAEnum(ActionType), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def to_dict(self) -> dict:
+        return {"day": self.day.isoformat(), "action": self.action.value, "count": self.count}
@@ -0,0 +1,107 @@
+import re
+from datetime import date, datetime
+from sqlalchemy import text
+from ..extensions import db
+from .models import Log
+from .repository import LogRepository
+
+
+PARTITION_NAME = re.compile(rf"^{Log.__tablename__}_y(\d{{4}})m(\d{{2}})$")
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{Log.__tablename__}_y{month.year}m{month.month:02d}"
+
+
+class LogPartitions:
+    """Monthly range partitions of the logs table on Postgres; other databases fall back to row deletes."""
+
+    @staticmethod
+    def is_partitioned() -> bool:
+        if db.engine.dialect.name != "postgresql":
+            return False
+        return db.session.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table"
+            ),
+            {"table": Log.__tablename__},
+        ).first() is not None
+
+    @staticmethod
+    def ensure(months_ahead: int = 2, today: date | None = None) -> list[str]:
+        if not LogPartitions.is_partitioned():
+            return []
+        today = today or date.today()
+        table = Log.__tablename__
+        db.session.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+        existing = set(LogPartitions.list_partitions())
+        created = []
+        for offset in range(months_ahead + 1):
+            start = month_start(today, offset)
+            name = partition_name(start)
+            if name not in existing:
+                LogPartitions._create(name, start, month_start(start, 1))
+            created.append(name)
+        db.session.commit()
+        return created
+
+    @staticmethod
+    def _create(name: str, start: date, end: date) -> None:
+        """Create one monthly partition, first moving rows for that month out of the default partition.
+
+        Postgres refuses to attach a range while the default partition holds rows inside it, so those rows are
+        copied through the parent (which routes them into the new partition) with the default detached.
+        """
+        table = Log.__tablename__
+        bounds = {"start": start, "end": end}
+        in_range = "created_at >= :start AND created_at < :end"
+        stranded = db.session.execute(
+            text(f"SELECT 1 FROM {table}_default WHERE {in_range} LIMIT 1"), bounds
+        ).first() is not None
+        if stranded:
+            db.session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {table}_default"))
+        db.session.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        if stranded:
+            db.session.execute(text(f"INSERT INTO {table} SELECT * FROM {table}_default WHERE {in_range}"), bounds)
+            db.session.execute(text(f"DELETE FROM {table}_default WHERE {in_range}"), bounds)
+            db.session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {table}_default DEFAULT"))
+
+    @staticmethod
+    def list_partitions() -> list[str]:
+        rows = db.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = :table ORDER BY child.relname"
+            ),
+            {"table": Log.__tablename__},
+        ).scalars().all()
+        return list(rows)
+
+    @staticmethod
+    def drop_expired(retention_months: int, today: date | None = None) -> int:
+        """Drop whole monthly partitions older than the retention window, then delete any leftover rows."""
+        cutoff = month_start(today or date.today(), -retention_months)
+        dropped = 0
+        if LogPartitions.is_partitioned():
+            table = Log.__tablename__
+            for name in LogPartitions.list_partitions():
+                match = PARTITION_NAME.match(name)
+                if not match or date(int(match[1]), int(match[2]), 1) >= cutoff:
+                    continue
+                db.session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                db.session.execute(text(f"DROP TABLE {name}"))
+                dropped += 1
+            db.session.commit()
+        LogRepository.delete_older_than(datetime.combine(cutoff, datetime.min.time()))
+        return dropped
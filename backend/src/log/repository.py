@@ -1,6 +1,10 @@
-from typing import Optional
+from typing import Iterator, Optional
+from datetime import date, datetime, timedelta
+from sqlalchemy import delete, func, insert, select, tuple_
 from ..extensions import db
-from .models import Log, ActionType
+from ..unit_of_work import commit
+from .dto import LogFilters
+from .models import Log, ActionType, LogDailyCount
 
 
 class LogRepository:
@@ -20,6 +24,70 @@ class LogRepository:
             details=details
         )
         db.session.add(log)
-        db.session.commit()
+        commit()
         return log
 
+
+    @staticmethod
+    def create_many(entries: list[dict]) -> None:
+        if not entries:
+            return
+        db.session.execute(insert(Log.__table__).values(entries))
+        commit()
+
+    @staticmethod
+    def rollup_daily_counts(day: date) -> int:
+        start = datetime.combine(day, datetime.min.time())
+        rows = db.session.execute(
+            select(Log.action, func.count())
+            .where(Log.created_at >= start, Log.created_at < start + timedelta(days=1))
+            .group_by(Log.action)
+        ).all()
+        db.session.execute(delete(LogDailyCount).where(LogDailyCount.day == day))
+        if rows:
+            db.session.execute(
+                insert(LogDailyCount),
+                [{"day": day, "action": action, "count": count} for action, count in rows],
+            )
+        commit()
+        return len(rows)
+
+    @staticmethod
+    def delete_older_than(cutoff: datetime) -> int:
+        deleted = db.session.execute(delete(Log).where(Log.created_at < cutoff)).rowcount
+        commit()
+        return deleted
+
+    @staticmethod
+    def find(filters: LogFilters, after: tuple[datetime, str] | None = None, limit: int = 50) -> list[Log]:
+        """Newest first, keyset-paginated on (created_at, id) strictly after the given sort key."""
+        stmt = select(Log)
+        if filters.action:
+            stmt = stmt.where(Log.action == filters.action)
+        if filters.user_id:
+            stmt = stmt.where(Log.user_id == filters.user_id)
+        if filters.resource_type:
+            stmt = stmt.where(Log.resource_type == filters.resource_type)
+        if filters.resource_id:
+            stmt = stmt.where(Log.resource_id == filters.resource_id)
+        if filters.since:
+            stmt = stmt.where(Log.created_at >= filters.since)
+        if filters.until:
+            stmt = stmt.where(Log.created_at < filters.until)
+        if after:
+            stmt = stmt.where(tuple_(Log.created_at, Log.id) < tuple_(*after))
+        stmt = stmt.order_by(Log.created_at.desc(), Log.id.desc()).limit(limit)
+        return list(db.session.execute(stmt).scalars())
+
+    @staticmethod
+    def iter_all(filters: LogFilters, batch_size: int = 1000) -> Iterator[Log]:
+        """Walk a whole range in short keyset queries instead of one long-running cursor."""
+        after = None
+        while True:
+            batch = LogRepository.find(filters, after=after, limit=batch_size)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = (batch[-1].created_at, batch[-1].id)
+            for log in batch:
+                db.session.expunge(log)
@@ -0,0 +1,129 @@
+import json
+from flask import Blueprint, Response, request, stream_with_context
+from flask_jwt_extended import jwt_required
+from ..access_control.decorators import require_roles
+from ..http_responses.responses import success, unprocessable_entity
+from ..pagination import parse_limit
+from .dto import LogFilters
+from .repository import LogRepository
+from .service import LogService
+
+
+logs_bp = Blueprint("logs", __name__)
+
+
+@logs_bp.get("")
+@jwt_required()
+@require_roles(["admin"])
+def list_logs():
+    """
+    List audit logs
+    ---
+    tags:
+      - Logs
+    security:
+      - bearerAuth: []
+    parameters:
+      - in: query
+        name: action
+        schema:
+          type: string
+      - in: query
+        name: user_id
+        schema:
+          type: string
+      - in: query
+        name: resource_type
+        schema:
+          type: string
+      - in: query
+        name: resource_id
+        schema:
+          type: string
+      - in: query
+        name: since
+        schema:
+          type: string
+          format: date-time
+        description: Inclusive lower bound on created_at
+      - in: query
+        name: until
+        schema:
+          type: string
+          format: date-time
+        description: Exclusive upper bound on created_at
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          default: 50
+          maximum: 500
+      - in: query
+        name: cursor
+        schema:
+          type: string
+        description: next_cursor from the previous page
+    responses:
+      200:
+        description: Page of audit logs, newest first
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                items:
+                  type: array
+                  items:
+                    type: object
+                next_cursor:
+                  type: string
+                  nullable: true
+      401:
+        description: Not authenticated
+      403:
+        description: Insufficient permissions (requires Admin)
+      422:
+        description: Invalid filter or cursor
+    """
+    try:
+        filters = LogFilters.from_args(request.args)
+        logs, next_cursor = LogService.list_logs(filters, request.args.get("cursor"), parse_limit(request.args.get("limit")))
+    except ValueError as e:
+        return unprocessable_entity(str(e))
+    return success(data={"items": [log.to_dict() for log in logs], "next_cursor": next_cursor})
+
+
+@logs_bp.get("/export")
+@jwt_required()
+@require_roles(["admin"])
+def export_logs():
+    """
+    Export audit logs as NDJSON
+    ---
+    tags:
+      - Logs
+    security:
+      - bearerAuth: []
+    description: Streams every matching log, one JSON object per line, newest first. Accepts the same filters as GET /api/logs.
+    responses:
+      200:
+        description: Newline-delimited JSON stream
+        content:
+          application/x-ndjson: {}
+      401:
+        description: Not authenticated
+      403:
+        description: Insufficient permissions (requires Admin)
+      422:
+        description: Invalid filter
+    """
+    try:
+        filters = LogFilters.from_args(request.args)
+    except ValueError as e:
+        return unprocessable_entity(str(e))
+
+    def generate():
+        for log in LogRepository.iter_all(filters):
+            yield json.dumps(log.to_dict()) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
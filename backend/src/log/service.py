@@ -1,8 +1,13 @@
 import logging
+import uuid
 from typing import Optional
 from datetime import datetime
+from .dto import LogFilters
 from .repository import LogRepository
-from .models import ActionType
+from .writer import audit_log_writer
+from .. import unit_of_work
+from .models import ActionType, Log
+from ..pagination import decode_keyset_cursor, paginate
 
 
 app_logger = logging.getLogger("app")
@@ -21,6 +26,19 @@ class LogService:
         
         details_json = json.dumps(details) if details else None
         
+        # Inside a unit of work the row is only flushed, so it commits together with the business change.
+        if unit_of_work.current() is None and audit_log_writer.enabled:
+            audit_log_writer.enqueue({
+                "id": str(uuid.uuid4()),
+                "action": action,
+                "user_id": user_id,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "details": details_json,
+                "created_at": datetime.utcnow(),
+            })
+            return
+        
         LogRepository.create(
             action=action,
             user_id=user_id,
@@ -29,24 +47,24 @@ class LogService:
             details=details_json
         )
     
+    @staticmethod
+    def list_logs(filters: LogFilters, cursor: str | None = None, limit: int = 50) -> tuple[list[Log], str | None]:
+        # Fetch one extra row to know whether another page exists without a COUNT.
+        logs = LogRepository.find(filters, after=decode_keyset_cursor(cursor), limit=limit + 1)
+        return paginate(logs, limit)
+    
     @staticmethod
     def log_info(message: str, context: Optional[dict] = None) -> None:
-        context_str = f" | Context: {context}" if context else ""
-        app_logger.info(f"[{datetime.utcnow().isoformat()}] {message}{context_str}")
+        app_logger.info(message, extra={"context": context})
     
     @staticmethod
     def log_error(message: str, error: Optional[Exception] = None, context: Optional[dict] = None) -> None:
-        error_str = f" | Error: {str(error)}" if error else ""
-        context_str = f" | Context: {context}" if context else ""
-        app_logger.error(f"[{datetime.utcnow().isoformat()}] {message}{error_str}{context_str}")
+        app_logger.error(message, extra={"error": error, "context": context})
     
     @staticmethod
     def log_warning(message: str, context: Optional[dict] = None) -> None:
-        context_str = f" | Context: {context}" if context else ""
-        app_logger.warning(f"[{datetime.utcnow().isoformat()}] {message}{context_str}")
+        app_logger.warning(message, extra={"context": context})
     
     @staticmethod
     def log_debug(message: str, context: Optional[dict] = None) -> None:
-        context_str = f" | Context: {context}" if context else ""
-        app_logger.debug(f"[{datetime.utcnow().isoformat()}] {message}{context_str}")
-
+        app_logger.debug(message, extra={"context": context})
@@ -0,0 +1,85 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from flask import Flask, g, has_request_context, request
+
+
+REQUEST_FIELDS = ("request_id", "user_id", "method", "route", "status", "latency_ms", "queries")
+
+
+def _timestamp(record: logging.LogRecord) -> str:
+    return datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request's id, user and route on the calling thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not has_request_context():
+            return True
+        record.request_id = g.get("request_id")
+        record.route = request.url_rule.rule if request.url_rule else request.path
+        jwt = g.get("_jwt_extended_jwt")
+        if jwt:
+            record.user_id = jwt.get("sub")
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"[{_timestamp(record)}] {record.getMessage()}"
+        error = getattr(record, "error", None)
+        if error:
+            line += f" | Error: {error}"
+        context = getattr(record, "context", None)
+        if context:
+            line += f" | Context: {context}"
+        fields = " ".join(f"{field}={getattr(record, field)}" for field in REQUEST_FIELDS if getattr(record, field, None) is not None)
+        if fields:
+            line += f" | Request: {fields}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": _timestamp(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in REQUEST_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        error = getattr(record, "error", None)
+        if error:
+            payload["error"] = str(error)
+        context = getattr(record, "context", None)
+        if context:
+            payload["context"] = context
+        return json.dumps(payload, default=str)
+
+
+def configure_logging(app: Flask) -> None:
+    """Route the "app" logger through a queue so formatting and stdout writes happen off the request thread."""
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(app.config.get("LOG_LEVEL", "INFO"))
+    if app_logger.handlers:
+        return
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(JsonFormatter() if app.config.get("LOG_FORMAT") == "json" else TextFormatter())
+
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RequestContextFilter())
+    listener = QueueListener(queue_handler.queue, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    app_logger.addHandler(queue_handler)
+    app_logger.propagate = False
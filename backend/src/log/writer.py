@@ -0,0 +1,109 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from ..extensions import db
+from .repository import LogRepository
+
+
+app_logger = logging.getLogger("app")
+
+
+class AuditLogWriter:
+    """Buffers audit rows in a bounded queue and writes them in multi-row INSERTs from a background thread."""
+
+    def __init__(self) -> None:
+        self.app = None
+        self.enabled = False
+        self.batch_size = 200
+        self.flush_interval = 0.5
+        self.overflow = "block"
+        self.block_timeout = 0.1
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.batch_size = app.config.get("AUDIT_LOG_BATCH_SIZE", 200)
+        self.flush_interval = app.config.get("AUDIT_LOG_FLUSH_INTERVAL_MS", 500) / 1000
+        self.overflow = app.config.get("AUDIT_LOG_OVERFLOW", "block")
+        self.block_timeout = app.config.get("AUDIT_LOG_BLOCK_TIMEOUT_MS", 100) / 1000
+        self._queue = queue.Queue(maxsize=app.config.get("AUDIT_LOG_QUEUE_SIZE", 10000))
+        self.enabled = bool(app.config.get("AUDIT_LOG_ASYNC")) and not app.config.get("TESTING")
+        if self.enabled:
+            self.start()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def enqueue(self, entry: dict) -> bool:
+        try:
+            self._queue.put(entry, block=self.overflow == "block", timeout=self.block_timeout)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            app_logger.warning("Audit log queue full, dropped entry (total dropped: %d)", self.dropped)
+            return False
+
+    def flush(self) -> None:
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        self._stopped.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout)
+        self.flush()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self) -> list[dict]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: list[dict]) -> None:
+        with self.app.app_context():
+            try:
+                LogRepository.create_many(batch)
+            except Exception as e:
+                db.session.rollback()
+                app_logger.error("Failed to write %d audit log entries", len(batch), extra={"error": e})
+
+
+audit_log_writer = AuditLogWriter()
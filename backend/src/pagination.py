@@ -0,0 +1,69 @@
+import base64
+import json
+from datetime import datetime
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def parse_limit(value: str | None, default: int = DEFAULT_PAGE_SIZE) -> int:
+    if value is None or value == "":
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor: the sort key of the last row of a page."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def decode_keyset_cursor(cursor: str | None) -> tuple[datetime, str] | None:
+    """Decode a (created_at, id) cursor produced by `paginate`."""
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(values[0]), str(values[1])
+    except (IndexError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def paginate(rows: list, limit: int) -> tuple[list, str | None]:
+    """Trim rows fetched with `limit + 1` and build the cursor for the next page, if there is one."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+def parse_fields(value: str | None, allowed: set[str]) -> list[str] | None:
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def select_fields(data: dict, fields: list[str] | None) -> dict:
+    return data if fields is None else {field: data[field] for field in fields}
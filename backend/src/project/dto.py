@@ -0,0 +1,44 @@
+from dataclasses import dataclass, fields
+from .models import ProjectStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectDTO:
+    """Read-only project snapshot rebuilt from cached payloads."""
+
+    id: str
+    name: str
+    description: str
+    status: ProjectStatus
+    owner_id: str | None
+    members: tuple[str, ...] = ()
+    version: int = 1
+    updated_at: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectDTO":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data["description"],
+            status=ProjectStatus(data["status"]),
+            owner_id=data.get("owner_id"),
+            members=tuple(data.get("members") or ()),
+            version=data.get("version", 1),
+            updated_at=data.get("updated_at"),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "status": self.status.value,
+            "owner_id": self.owner_id,
+            "members": list(self.members),
+            "version": self.version,
+            "updated_at": self.updated_at,
+        }
+
+
+PROJECT_FIELDS = frozenset(field.name for field in fields(ProjectDTO))
@@ -0,0 +1,78 @@
+from ..cache import cache
+from ..unit_of_work import after_commit
+from .repository import ProjectRepository
+
+
+MEMBERSHIP_CACHE_TTL = 300
+
+
+def members_key(project_id: str) -> str:
+    return f"project:{project_id}:members"
+
+
+def user_projects_key(user_id: str) -> str:
+    return f"user:{user_id}:projects"
+
+
+class ProjectMembership:
+    """Who may access a project (its owner and members), indexed as Redis sets in both directions.
+
+    Writes drop the affected sets after commit, which also bumps their generation; a set is rebuilt from the
+    database on the next read and only stored if no write invalidated it meanwhile. Authorization never loads
+    `Project.members`.
+    """
+
+    @staticmethod
+    def is_member(project_id: str, user_id: str) -> bool | None:
+        """Owner or member check, a single SISMEMBER when warm; None when the project does not exist."""
+        found = cache.set_contains(members_key(project_id), user_id)
+        if found is not None:
+            return found
+        members = ProjectMembership.member_ids(project_id)
+        return None if members is None else user_id in members
+
+    @staticmethod
+    def member_ids(project_id: str) -> set[str] | None:
+        key = members_key(project_id)
+        members = cache.get_set(key)
+        if members is None:
+            version = cache.version(key)
+            members = ProjectRepository.member_ids(project_id)
+            if members is not None and version is not None:
+                cache.set_set(key, members, version, ex=MEMBERSHIP_CACHE_TTL)
+        return members
+
+    @staticmethod
+    def project_ids(user_id: str) -> set[str]:
+        key = user_projects_key(user_id)
+        project_ids = cache.get_set(key)
+        if project_ids is None:
+            version = cache.version(key)
+            project_ids = ProjectRepository.project_ids_for_user(user_id)
+            if version is not None:
+                cache.set_set(key, project_ids, version, ex=MEMBERSHIP_CACHE_TTL)
+        return project_ids
+
+    @staticmethod
+    def created(project_id: str, owner_id: str) -> None:
+        ProjectMembership._invalidate([members_key(project_id), user_projects_key(owner_id)])
+
+    @staticmethod
+    def added(project_id: str, user_id: str) -> None:
+        ProjectMembership._invalidate([members_key(project_id), user_projects_key(user_id)])
+
+    @staticmethod
+    def removed(project_id: str, user_id: str) -> None:
+        ProjectMembership._invalidate([members_key(project_id), user_projects_key(user_id)])
+
+    @staticmethod
+    def project_deleted(project_id: str, user_ids: list[str]) -> None:
+        ProjectMembership._invalidate([members_key(project_id), *(user_projects_key(user_id) for user_id in user_ids)])
+
+    @staticmethod
+    def user_deleted(user_id: str, project_ids: set[str]) -> None:
+        ProjectMembership._invalidate([user_projects_key(user_id), *(members_key(project_id) for project_id in project_ids)])
+
+    @staticmethod
+    def _invalidate(keys: list[str]) -> None:
+        after_commit(lambda: cache.delete_many(keys))
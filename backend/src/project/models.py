@@ -5,6 +5,7 @@ from sqlalchemy import String, DateTime, Enum as SAEnum, ForeignKey, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
 from ..soft_delete import SoftDeleteMixin
+from ..versioning import VersionedMixin
 
 
 class ProjectStatus(str, Enum):
@@ -21,7 +22,7 @@ project_members = Table(
 )
 
 
-class Project(db.Model, SoftDeleteMixin):
+class Project(db.Model, SoftDeleteMixin, VersionedMixin):
     __tablename__ = "projects"
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(160), nullable=False)
@@ -42,4 +43,6 @@ class Project(db.Model, SoftDeleteMixin):
             "status": self.status.value,
             "owner_id": self.owner_id,
             "members": [m.id for m in self.members],
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -1,34 +1,89 @@
+from datetime import datetime
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import selectinload
 from ..extensions import db
-from .models import Project
+from ..unit_of_work import commit
+from ..request_scope import get_or_load
 from ..user.models import User
+from .models import Project, ProjectStatus, project_members
 
 
 class ProjectRepository:
     @staticmethod
     def create(project: Project) -> Project:
         db.session.add(project)
-        db.session.commit()
+        commit()
         return project
 
     @staticmethod
     def get_by_id(project_id: str) -> Project | None:
-        return Project.query.filter(Project.deleted_at.is_(None)).filter_by(id=project_id).first()
+        return get_or_load(
+            Project,
+            project_id,
+            lambda: Project.query.filter(Project.deleted_at.is_(None)).filter_by(id=project_id).first(),
+        )
+
+    @staticmethod
+    def get_many(project_ids: list[str]) -> list[Project]:
+        if not project_ids:
+            return []
+        return Project.query.filter(Project.deleted_at.is_(None), Project.id.in_(project_ids)).all()
 
     @staticmethod
-    def list_for_user(user_id: str) -> list[Project]:
-        return (
-            Project.query.filter(Project.deleted_at.is_(None))
-            .join(Project.members, isouter=True)
-            .filter((Project.owner_id == user_id) | (User.id == user_id))
-            .all()
+    def list_for_user(
+        user_id: str,
+        status: ProjectStatus | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[Project]:
+        # Membership as a subquery rather than a join, so each project is one row and LIMIT counts projects.
+        member_of = select(project_members.c.project_id).where(project_members.c.user_id == user_id)
+        # to_dict() reads every project's members; load them all in one extra SELECT ... IN instead of one per project.
+        query = (
+            Project.query.options(selectinload(Project.members))
+            .filter(Project.deleted_at.is_(None))
+            .filter((Project.owner_id == user_id) | Project.id.in_(member_of))
         )
+        if status:
+            query = query.filter(Project.status == status)
+        if after:
+            query = query.filter(tuple_(Project.created_at, Project.id) > tuple_(*after))
+        query = query.order_by(Project.created_at, Project.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def member_ids(project_id: str) -> set[str] | None:
+        """Owner and member ids of a live project, or None when there is no such project."""
+        owner = db.session.execute(
+            select(Project.owner_id).where(Project.id == project_id, Project.deleted_at.is_(None))
+        ).first()
+        if owner is None:
+            return None
+        members = db.session.execute(
+            select(project_members.c.user_id)
+            .join(User, User.id == project_members.c.user_id)
+            .where(project_members.c.project_id == project_id, User.deleted_at.is_(None))
+        ).scalars()
+        return {*members, *([owner.owner_id] if owner.owner_id else [])}
+
+    @staticmethod
+    def project_ids_for_user(user_id: str) -> set[str]:
+        member_of = select(project_members.c.project_id).where(project_members.c.user_id == user_id)
+        live_user = select(User.id).where(User.id == user_id, User.deleted_at.is_(None)).exists()
+        return set(db.session.execute(
+            select(Project.id)
+            .where(Project.deleted_at.is_(None), live_user)
+            .where((Project.owner_id == user_id) | Project.id.in_(member_of))
+        ).scalars())
 
     @staticmethod
     def update(project: Project) -> Project:
-        db.session.commit()
+        commit()
         return project
 
     @staticmethod
     def delete(project: Project) -> None:
         project.soft_delete()
-        db.session.commit()
+        commit()
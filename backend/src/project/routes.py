@@ -1,10 +1,14 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from ..access_control.decorators import require_roles
+from ..access_control.decorators import authorize, require_roles
 from .service import ProjectService
-from ..http_responses.responses import success, created, not_found, no_content, bad_request, forbidden, unprocessable_entity
+from .models import ProjectStatus
+from .dto import PROJECT_FIELDS
+from ..pagination import parse_fields, parse_limit, select_fields
+from ..http_responses.responses import conditional, if_match_version, version_etag, success, created, not_found, no_content, bad_request, forbidden, unprocessable_entity
 from ..log.service import LogService
 from ..log.models import ActionType
+from ..log.decorator import log_action_to_db
 
 
 projects_bp = Blueprint("projects", __name__)
@@ -13,6 +17,7 @@ projects_bp = Blueprint("projects", __name__)
 @projects_bp.post("")
 @jwt_required()
 @require_roles(["manager", "admin"])  
+@log_action_to_db(transactional=True)
 def create_project():
     """
     Create new project
@@ -86,6 +91,29 @@ def list_projects():
       - Projects
     security:
       - bearerAuth: []
+    parameters:
+      - in: query
+        name: status
+        schema:
+          type: string
+          enum: [planned, in_progress, completed]
+      - in: query
+        name: fields
+        schema:
+          type: string
+          example: id,name,status
+        description: Comma-separated subset of fields to return
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          maximum: 500
+        description: Page size. With limit or cursor the response is {items, next_cursor} instead of a plain array
+      - in: query
+        name: cursor
+        schema:
+          type: string
+        description: next_cursor from the previous page
     responses:
       200:
         description: List of projects
@@ -110,14 +138,35 @@ def list_projects():
                     type: array
                     items:
                       type: string
+      304:
+        description: Not modified (If-None-Match matches the current ETag)
       401:
         description: Not authenticated
+      422:
+        description: Invalid filter, field or cursor
     """
-    return success(data=[p.to_dict() for p in ProjectService.list_projects_for_user(get_jwt_identity())])
+    requester_id = get_jwt_identity()
+
+    def build():
+        try:
+            fields = parse_fields(request.args.get("fields"), PROJECT_FIELDS)
+            status = ProjectStatus(request.args["status"]) if request.args.get("status") else None
+            if "limit" in request.args or "cursor" in request.args:
+                projects, next_cursor = ProjectService.list_projects_page(
+                    requester_id, status, request.args.get("cursor"), parse_limit(request.args.get("limit"))
+                )
+                return success(data={"items": [select_fields(p.to_dict(), fields) for p in projects], "next_cursor": next_cursor})
+            projects = ProjectService.list_projects_for_user(requester_id, status)
+        except ValueError as e:
+            return unprocessable_entity(str(e))
+        return success(data=[select_fields(p.to_dict(), fields) for p in projects])
+
+    return conditional(f"projects:{requester_id}", build)
 
 
 @projects_bp.get("/<project_id>")
 @jwt_required()
+@authorize(project_arg="project_id")
 def get_project(project_id: str):
     """
     Get project by ID
@@ -158,20 +207,35 @@ def get_project(project_id: str):
                       type: array
                       items:
                         type: string
+                    version:
+                      type: integer
+        headers:
+          ETag:
+            description: The project version, usable as If-Match on PATCH
+            schema:
+              type: string
+      304:
+        description: Not modified (If-None-Match matches the current ETag)
       401:
         description: Not authenticated
+      403:
+        description: Requester is neither owner nor member of the project (admins bypass)
       404:
         description: Project not found
     """
-    project = ProjectService.get_by_id(project_id)
-    if not project:
-        return not_found()
-    return success(data=project.to_dict())
+    def build():
+        project = ProjectService.get_by_id(project_id)
+        if not project:
+            return not_found()
+        return success(data=project.to_dict())
+
+    return conditional(f"project:{project_id}", build, etag_of=version_etag)
 
 
 @projects_bp.patch("/<project_id>")
 @jwt_required()
 @require_roles(["manager", "admin"])  
+@log_action_to_db(transactional=True)
 def update_project(project_id: str):
     """
     Update project
@@ -217,11 +281,13 @@ def update_project(project_id: str):
         description: Only the owner can update the project
       404:
         description: Project not found
+      412:
+        description: If-Match does not match the current version
     """
     try:
         data = request.get_json() or {}
         requester_id = get_jwt_identity()
-        project = ProjectService.update_project(project_id, requester_id, data)
+        project = ProjectService.update_project(project_id, requester_id, data, if_match_version())
         LogService.log_action(action=ActionType.PROJECT_UPDATED, user_id=requester_id, resource_type="project", resource_id=project_id)
         LogService.log_info("Project updated successfully", context={"project_id": project_id})
         return success(data=project.to_dict())
@@ -236,6 +302,7 @@ def update_project(project_id: str):
 @projects_bp.delete("/<project_id>")
 @jwt_required()
 @require_roles(["manager", "admin"])  
+@log_action_to_db(transactional=True)
 def delete_project(project_id: str):
     """
     Delete project
@@ -273,6 +340,7 @@ def delete_project(project_id: str):
 @projects_bp.post("/<project_id>/members")
 @jwt_required()
 @require_roles(["manager", "admin"])  
+@log_action_to_db(transactional=True)
 def add_member(project_id: str):
     """
     Add member to project
@@ -328,6 +396,7 @@ def add_member(project_id: str):
 @projects_bp.delete("/<project_id>/members/<user_id>")
 @jwt_required()
 @require_roles(["manager", "admin"])  
+@log_action_to_db(transactional=True)
 def remove_member(project_id: str, user_id: str):
     """
     Remove member from project
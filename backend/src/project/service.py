@@ -1,17 +1,24 @@
 from .repository import ProjectRepository
 from ..user.repository import UserRepository
 from ..task.repository import TaskRepository
+from ..task.stats import ProjectTaskStatsRepository
 from .models import Project, ProjectStatus
-from ..task.models import TaskStatus
+from .dto import ProjectDTO
+from .membership import ProjectMembership
 from ..cache import cache
+from ..unit_of_work import after_commit
+from ..pagination import decode_keyset_cursor, paginate
+
+
+PROJECTS_CACHE_TTL = 60
 
 
 class ProjectService:
     @staticmethod
-    def _invalidate_project_cache(project: Project):
-        cache.delete(f"projects:{project.owner_id}")
-        for member in project.members:
-            cache.delete(f"projects:{member.id}")
+    def _invalidate_project_cache(project: Project, *extra_user_ids: str):
+        user_ids = [project.owner_id, *(m.id for m in project.members), *extra_user_ids]
+        keys = [f"project:{project.id}", *(f"projects:{user_id}" for user_id in user_ids if user_id)]
+        after_commit(lambda: cache.delete_many(keys))
 
     @staticmethod
     def create_project(owner_id: str, data: dict) -> Project:
@@ -23,7 +30,9 @@ class ProjectService:
             owner_id=owner.id if owner else owner_id,
         )
         project = ProjectRepository.create(project)
-        cache.delete(f"projects:{owner_id}")
+        after_commit(lambda: cache.delete(f"projects:{owner_id}"))
+        if project.owner_id:
+            ProjectMembership.created(project.id, project.owner_id)
         return project
 
     @staticmethod
@@ -31,11 +40,36 @@ class ProjectService:
         return ProjectRepository.get_by_id(project_id)
 
     @staticmethod
-    def list_projects_for_user(user_id: str) -> list[Project]:
-        return ProjectRepository.list_for_user(user_id)
+    def list_projects_for_user(user_id: str, status: ProjectStatus | None = None) -> list[ProjectDTO]:
+        projects = cache.get_or_set_models(
+            f"projects:{user_id}",
+            ProjectDTO,
+            lambda: [ProjectDTO.from_dict(p.to_dict()) for p in ProjectRepository.list_for_user(user_id)],
+            ex=PROJECTS_CACHE_TTL,
+        )
+        if status:
+            projects = [p for p in projects if p.status == status]
+        return projects
+
+    @staticmethod
+    def is_member(project_id: str, user_id: str) -> bool | None:
+        """Owner or member check from the membership index; None when the project does not exist."""
+        return ProjectMembership.is_member(project_id, user_id)
 
     @staticmethod
-    def update_project(project_id: str, requester_id: str, data: dict) -> Project:
+    def project_ids_for_user(user_id: str) -> set[str]:
+        return ProjectMembership.project_ids(user_id)
+
+    @staticmethod
+    def list_projects_page(
+        user_id: str, status: ProjectStatus | None = None, cursor: str | None = None, limit: int = 50
+    ) -> tuple[list[ProjectDTO], str | None]:
+        projects = ProjectRepository.list_for_user(user_id, status=status, after=decode_keyset_cursor(cursor), limit=limit + 1)
+        projects, next_cursor = paginate(projects, limit)
+        return [ProjectDTO.from_dict(p.to_dict()) for p in projects], next_cursor
+
+    @staticmethod
+    def update_project(project_id: str, requester_id: str, data: dict, expected_version: int | None = None) -> Project:
         project = ProjectRepository.get_by_id(project_id)
         if not project:
             raise ValueError("not found")
@@ -43,6 +77,7 @@ class ProjectService:
             raise ValueError("completed projects are read-only")
         if requester_id != project.owner_id:
             raise PermissionError("only owner can update project")
+        project.check_version(expected_version)
         if "name" in data:
             project.name = data["name"]
         if "description" in data:
@@ -61,6 +96,7 @@ class ProjectService:
         if requester_id != project.owner_id:
             raise PermissionError("only owner can delete project")
         ProjectService._invalidate_project_cache(project)
+        ProjectMembership.project_deleted(project.id, [project.owner_id, *(m.id for m in project.members)])
         ProjectRepository.delete(project)
 
     @staticmethod
@@ -75,8 +111,10 @@ class ProjectService:
         user = UserRepository.get_by_id(user_id)
         if user and user not in project.members:
             project.members.append(user)
+            project.touch()
             project = ProjectRepository.update(project)
-            cache.delete(f"projects:{user_id}")
+            ProjectService._invalidate_project_cache(project)
+            ProjectMembership.added(project.id, user.id)
 
     @staticmethod
     def remove_member(project_id: str, requester_id: str, user_id: str) -> None:
@@ -86,16 +124,19 @@ class ProjectService:
         if requester_id != project.owner_id:
             raise PermissionError("only owner can remove members")
         project.members = [m for m in project.members if m.id != user_id]
+        project.touch()
         ProjectRepository.update(project)
-        cache.delete(f"projects:{user_id}")
+        ProjectService._invalidate_project_cache(project, user_id)
+        if user_id != project.owner_id:
+            ProjectMembership.removed(project.id, user_id)
 
     @staticmethod
     def recompute_status_if_completed(project_id: str) -> None:
         project = ProjectRepository.get_by_id(project_id)
         if not project:
             return
-        tasks = TaskRepository.list_for_project(project_id)
-        if tasks and all(t.status == TaskStatus.DONE for t in tasks):
+        # The aggregate re-check guards the irreversible COMPLETED transition against counter drift.
+        if ProjectTaskStatsRepository.get(project_id).is_completed and TaskRepository.status_counts(project_id).is_completed:
             project.status = ProjectStatus.COMPLETED
             project = ProjectRepository.update(project)
             ProjectService._invalidate_project_cache(project)
@@ -3,6 +3,8 @@ from .auth.routes import auth_bp
 from .user.routes import users_bp
 from .project.routes import projects_bp
 from .task.routes import tasks_bp
+from .log.routes import logs_bp
+from .cache.routes import cache_bp
 
 
 def register_blueprints(app: Flask) -> None:
@@ -10,3 +12,5 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(users_bp, url_prefix="/api/users")
     app.register_blueprint(projects_bp, url_prefix="/api/projects")
     app.register_blueprint(tasks_bp, url_prefix="/api/tasks")
+    app.register_blueprint(logs_bp, url_prefix="/api/logs")
+    app.register_blueprint(cache_bp, url_prefix="/api/cache")
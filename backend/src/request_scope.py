@@ -0,0 +1,67 @@
+import logging
+import time
+import uuid
+from typing import Callable, TypeVar
+from flask import Flask, g, has_app_context, request
+from sqlalchemy import event
+from .extensions import db
+
+
+T = TypeVar("T")
+app_logger = logging.getLogger("app")
+
+
+def reset() -> None:
+    """Start a fresh identity map, query counter and request id for the current request."""
+    g.identity_map = {}
+    g.query_count = 0
+    g.request_id = request.headers.get("X-Request-ID", "")[:64] or uuid.uuid4().hex
+    g.request_started = time.perf_counter()
+
+
+def get_or_load(model: type[T], key: str, loader: Callable[[], T | None]) -> T | None:
+    """Return the instance already loaded in this request for (model, key), or load and remember it."""
+    if not has_app_context():
+        return loader()
+    identity_map = g.setdefault("identity_map", {})
+    instance = identity_map.get((model, key))
+    if instance is not None and not instance.is_deleted():
+        return instance
+    instance = loader()
+    if instance is not None:
+        identity_map[(model, key)] = instance
+    else:
+        identity_map.pop((model, key), None)
+    return instance
+
+
+def query_count() -> int:
+    return g.get("query_count", 0) if has_app_context() else 0
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    if has_app_context():
+        g.query_count = g.get("query_count", 0) + 1
+
+
+def init_request_scope(app: Flask) -> None:
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _count_query)
+
+    app.before_request(reset)
+
+    @app.after_request
+    def report_request(response):
+        count = query_count()
+        latency_ms = round((time.perf_counter() - g.get("request_started", time.perf_counter())) * 1000, 2)
+        # Only slow or query-heavy requests are worth a line at INFO; the rest stay available at DEBUG.
+        notable = latency_ms >= app.config.get("REQUEST_LOG_SLOW_MS", 500) or count > app.config.get("REQUEST_LOG_MAX_QUERIES", 20)
+        app_logger.log(
+            logging.INFO if notable else logging.DEBUG,
+            "Request finished",
+            extra={"method": request.method, "status": response.status_code, "latency_ms": latency_ms, "queries": count},
+        )
+        response.headers["X-Request-ID"] = g.get("request_id", "")
+        if app.config.get("EXPOSE_QUERY_COUNT"):
+            response.headers["X-Query-Count"] = str(count)
+        return response
@@ -10,4 +10,37 @@ class AppConfig:
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    CACHE_SERIALIZER = os.getenv("CACHE_SERIALIZER", "orjson")
+    CACHE_SCHEMA_VERSION = int(os.getenv("CACHE_SCHEMA_VERSION", "1"))
+    CACHE_L1_MAX_SIZE = int(os.getenv("CACHE_L1_MAX_SIZE", "0"))
+    CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", "5"))
+    SOCKETIO_ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading")
+    SOCKETIO_MESSAGE_QUEUE = os.getenv("SOCKETIO_MESSAGE_QUEUE", REDIS_URL)
+    PROGRESS_BROADCAST_WINDOW_MS = int(os.getenv("PROGRESS_BROADCAST_WINDOW_MS", "250"))
+    AUDIT_LOG_ASYNC = os.getenv("AUDIT_LOG_ASYNC", "true").lower() == "true"
+    AUDIT_LOG_QUEUE_SIZE = int(os.getenv("AUDIT_LOG_QUEUE_SIZE", "10000"))
+    AUDIT_LOG_BATCH_SIZE = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "200"))
+    AUDIT_LOG_FLUSH_INTERVAL_MS = int(os.getenv("AUDIT_LOG_FLUSH_INTERVAL_MS", "500"))
+    AUDIT_LOG_OVERFLOW = os.getenv("AUDIT_LOG_OVERFLOW", "block")
+    AUDIT_LOG_BLOCK_TIMEOUT_MS = int(os.getenv("AUDIT_LOG_BLOCK_TIMEOUT_MS", "100"))
+    PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+    PASSWORD_HASH_POOL = os.getenv("PASSWORD_HASH_POOL", "true").lower() == "true"
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+    TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
+    RATE_LIMIT_WINDOW_SECONDS = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
+    RATE_LIMIT_LOGIN_PER_IP = int(os.getenv("RATE_LIMIT_LOGIN_PER_IP", "30"))
+    RATE_LIMIT_LOGIN_PER_EMAIL = int(os.getenv("RATE_LIMIT_LOGIN_PER_EMAIL", "10"))
+    UNKNOWN_EMAIL_CACHE_TTL = int(os.getenv("UNKNOWN_EMAIL_CACHE_TTL", "300"))
+    TOKEN_BLOCKLIST_REFRESH_SECONDS = float(os.getenv("TOKEN_BLOCKLIST_REFRESH_SECONDS", "5"))
+    TOKEN_BLOCKLIST_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLOCKLIST_BLOOM_CAPACITY", "100000"))
+    TOKEN_BLOCKLIST_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_BLOCKLIST_BLOOM_ERROR_RATE", "0.001"))
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_RETENTION_MONTHS = int(os.getenv("LOG_RETENTION_MONTHS", "12"))
+    LOG_PARTITION_MONTHS_AHEAD = int(os.getenv("LOG_PARTITION_MONTHS_AHEAD", "2"))
+    LOG_ROLLUP_ENABLED = os.getenv("LOG_ROLLUP_ENABLED", "true").lower() == "true"
+    EXPOSE_QUERY_COUNT = os.getenv("EXPOSE_QUERY_COUNT", "false").lower() == "true"
+    REQUEST_LOG_SLOW_MS = float(os.getenv("REQUEST_LOG_SLOW_MS", "500"))
+    REQUEST_LOG_MAX_QUERIES = int(os.getenv("REQUEST_LOG_MAX_QUERIES", "20"))
     SWAGGER = {"title": "Project Management API", "uiversion": 3}
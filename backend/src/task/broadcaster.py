@@ -0,0 +1,75 @@
+import os
+import threading
+from ..extensions import socketio
+from ..log.service import LogService
+from ..project.membership import ProjectMembership
+
+
+def user_room(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+class ProgressBroadcaster:
+    """Coalesces project_progress events so each project emits at most once per window.
+
+    Events go to the rooms of the project's current members, read from the membership index when emitting, so
+    a removed member stops receiving them without the socket having to leave a room.
+    """
+
+    def __init__(self) -> None:
+        self.app = None
+        self.window = 0.25
+        self._pending: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker_pid: int | None = None
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.window = app.config.get("PROGRESS_BROADCAST_WINDOW_MS", 250) / 1000
+
+    def publish(self, project_id: str, percent: int) -> None:
+        if self.window <= 0:
+            self._emit(project_id, percent)
+            return
+        with self._lock:
+            self._pending[project_id] = percent
+        self._ensure_worker()
+        self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for project_id, percent in pending.items():
+            self._emit(project_id, percent)
+
+    def _emit(self, project_id: str, percent: int) -> None:
+        member_ids = ProjectMembership.member_ids(project_id)
+        if not member_ids:
+            return
+        rooms = [user_room(user_id) for user_id in sorted(member_ids)]
+        socketio.emit("project_progress", {"project_id": project_id, "percent": percent}, to=rooms)
+
+    def _ensure_worker(self) -> None:
+        if self._worker_pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker_pid == os.getpid():
+                return
+            self._worker_pid = os.getpid()
+        socketio.start_background_task(self._run)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            # Let further updates for the same projects pile up before emitting the latest values.
+            socketio.sleep(self.window)
+            self._wakeup.clear()
+            try:
+                with self.app.app_context():
+                    self.flush()
+            except Exception as e:
+                LogService.log_error("Failed to broadcast project progress", error=e)
+
+
+progress_broadcaster = ProgressBroadcaster()
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, fields
+from .models import TaskStatus
+
+
+@dataclass(frozen=True, slots=True)
+class TaskDTO:
+    """Read-only task snapshot rebuilt from cached payloads."""
+
+    id: str
+    title: str
+    description: str
+    status: TaskStatus
+    project_id: str
+    assignee_id: str | None
+    version: int = 1
+    updated_at: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaskDTO":
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            status=TaskStatus(data["status"]),
+            project_id=data["project_id"],
+            assignee_id=data.get("assignee_id"),
+            version=data.get("version", 1),
+            updated_at=data.get("updated_at"),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status.value,
+            "project_id": self.project_id,
+            "assignee_id": self.assignee_id,
+            "version": self.version,
+            "updated_at": self.updated_at,
+        }
+
+
+TASK_FIELDS = frozenset(field.name for field in fields(TaskDTO))
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStatusCounts:
+    """Task totals for one project, keyed by TaskStatus value."""
+
+    total: int
+    by_status: dict[str, int]
+
+    def count(self, status: TaskStatus) -> int:
+        return self.by_status.get(status.value, 0)
+
+    @property
+    def percent_done(self) -> int:
+        if not self.total:
+            return 0
+        return int((self.count(TaskStatus.DONE) / self.total) * 100)
+
+    @property
+    def is_completed(self) -> bool:
+        return self.total > 0 and self.count(TaskStatus.DONE) == self.total
+
+    def to_dict(self) -> dict:
+        return {"total": self.total, **{status.value: self.count(status) for status in TaskStatus}}
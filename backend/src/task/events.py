@@ -0,0 +1,44 @@
+from flask import request, session
+from flask_socketio import SocketIO, join_room
+from flask_jwt_extended import decode_token
+from ..project.service import ProjectService
+from ..user.service import UserService
+from ..auth.blocklist import token_blocklist
+from ..log.service import LogService
+from .broadcaster import user_room
+
+
+def handle_connect(auth=None):
+    token = (auth or {}).get("token") or request.args.get("token")
+    if not token:
+        return False
+    try:
+        claims = decode_token(token)
+    except Exception as e:
+        LogService.log_warning("Socket connection rejected: invalid token", context={"error": str(e)})
+        return False
+    if claims.get("type") != "access":
+        return False
+    # decode_token skips the token_in_blocklist loader that @jwt_required() applies to HTTP requests.
+    if token_blocklist.is_revoked(claims["jti"]):
+        return False
+
+    user_id = str(claims["sub"])
+    if not UserService.get_by_id(user_id):
+        return False
+    session["user_id"] = user_id
+    join_room(user_room(user_id))
+
+
+def handle_join_project(data):
+    """Whether this socket receives the project's events; membership is checked on every emit, so no room is joined."""
+    user_id = session.get("user_id")
+    project_id = (data or {}).get("project_id")
+    if not user_id or not project_id:
+        return {"joined": False}
+    return {"joined": bool(ProjectService.is_member(project_id, user_id))}
+
+
+def register_socket_handlers(socketio: SocketIO) -> None:
+    socketio.on_event("connect", handle_connect)
+    socketio.on_event("join_project", handle_join_project)
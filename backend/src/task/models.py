@@ -1,10 +1,11 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import String, DateTime, Enum as SAEnum, ForeignKey
+from sqlalchemy import Index, String, DateTime, Integer, Enum as SAEnum, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
 from ..soft_delete import SoftDeleteMixin
+from ..versioning import VersionedMixin
 
 
 class TaskStatus(str, Enum):
@@ -14,15 +15,19 @@ class TaskStatus(str, Enum):
     AWAITING_REASSIGNMENT = "awaiting_reassignment"
 
 
-class Task(db.Model, SoftDeleteMixin):
+class Task(db.Model, SoftDeleteMixin, VersionedMixin):
     __tablename__ = "tasks"
+    # Serves the keyset-paginated task list of a project, ordered by (created_at, id).
+    __table_args__ = (Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),)
+
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(String(500), nullable=False)
-    status: Mapped[TaskStatus] = mapped_column(SAEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
+    status: Mapped[TaskStatus] = mapped_column(SAEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False, active_history=True)
     project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
     assignee_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("users.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, default=None, index=True, active_history=True)
 
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", back_populates="tasks")
@@ -35,4 +40,18 @@ class Task(db.Model, SoftDeleteMixin):
             "status": self.status.value,
             "project_id": self.project_id,
             "assignee_id": self.assignee_id,
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class ProjectTaskStats(db.Model):
+    """Per-project task counters, kept in step with task mutations by the flush listener in task.stats."""
+
+    __tablename__ = "project_task_stats"
+    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pending: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    in_progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    awaiting_reassignment: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
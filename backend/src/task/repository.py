@@ -1,28 +1,81 @@
+from datetime import datetime
+from sqlalchemy import func, select, tuple_
 from ..extensions import db
-from .models import Task
+from ..unit_of_work import commit
+from ..request_scope import get_or_load
+from .models import Task, TaskStatus
+from .dto import TaskStatusCounts
 
 
 class TaskRepository:
     @staticmethod
     def create(task: Task) -> Task:
         db.session.add(task)
-        db.session.commit()
+        commit()
         return task
 
+    @staticmethod
+    def create_many(tasks: list[Task]) -> list[Task]:
+        # Client-side UUID keys let the ORM batch these into multi-row INSERTs.
+        db.session.add_all(tasks)
+        commit()
+        return tasks
+
+    @staticmethod
+    def get_many(task_ids: list[str]) -> list[Task]:
+        if not task_ids:
+            return []
+        return Task.query.filter(Task.deleted_at.is_(None), Task.id.in_(task_ids)).all()
+
     @staticmethod
     def get_by_id(task_id: str) -> Task | None:
-        return Task.query.filter(Task.deleted_at.is_(None)).filter_by(id=task_id).first()
+        return get_or_load(
+            Task,
+            task_id,
+            lambda: Task.query.filter(Task.deleted_at.is_(None)).filter_by(id=task_id).first(),
+        )
 
     @staticmethod
-    def list_for_project(project_id: str) -> list[Task]:
-        return Task.query.filter(Task.deleted_at.is_(None)).filter_by(project_id=project_id).all()
+    def list_for_project(
+        project_id: str,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        query = Task.query.filter(Task.deleted_at.is_(None)).filter_by(project_id=project_id)
+        if status:
+            query = query.filter(Task.status == status)
+        if assignee_id:
+            query = query.filter(Task.assignee_id == assignee_id)
+        if after:
+            query = query.filter(tuple_(Task.created_at, Task.id) > tuple_(*after))
+        query = query.order_by(Task.created_at, Task.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def status_counts(project_id: str) -> TaskStatusCounts:
+        row = db.session.execute(
+            select(
+                func.count().label("total"),
+                *(func.count().filter(Task.status == status).label(status.value) for status in TaskStatus),
+            ).where(Task.project_id == project_id, Task.deleted_at.is_(None))
+        ).mappings().one()
+        return TaskStatusCounts(total=row["total"], by_status={status.value: row[status.value] for status in TaskStatus})
 
     @staticmethod
     def update(task: Task) -> Task:
-        db.session.commit()
+        commit()
         return task
 
+    @staticmethod
+    def update_many(tasks: list[Task]) -> list[Task]:
+        commit()
+        return tasks
+
     @staticmethod
     def delete(task: Task) -> None:
         task.soft_delete()
-        db.session.commit()
+        commit()
@@ -1,9 +1,14 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from .service import TaskService
-from ..http_responses.responses import success, created, not_found, unprocessable_entity, forbidden
+from .models import TaskStatus
+from .dto import TASK_FIELDS
+from ..pagination import parse_fields, parse_limit, select_fields
+from ..http_responses.responses import conditional, if_match_version, success, created, not_found, unprocessable_entity, forbidden
 from ..log.service import LogService
 from ..log.models import ActionType
+from ..log.decorator import log_action_to_db
+from ..access_control.decorators import authorize
 
 
 tasks_bp = Blueprint("tasks", __name__)
@@ -11,6 +16,7 @@ tasks_bp = Blueprint("tasks", __name__)
 
 @tasks_bp.post("")
 @jwt_required()
+@log_action_to_db(transactional=True)
 def create_task():
     """
     Create new task
@@ -68,6 +74,8 @@ def create_task():
                       type: string
       401:
         description: Not authenticated
+      403:
+        description: Requester is neither owner nor member of the project (admins bypass)
       404:
         description: Project not found
     """
@@ -81,10 +89,158 @@ def create_task():
     except ValueError as e:
         LogService.log_error("Failed to create task", error=e, context={"project_id": data.get("project_id")})
         return not_found(str(e)) if "not found" in str(e).lower() else unprocessable_entity(str(e))
+    except PermissionError as e:
+        LogService.log_error("Permission denied to create task", error=e, context={"project_id": data.get("project_id")})
+        return forbidden(str(e))
+
+
+@tasks_bp.post("/bulk")
+@jwt_required()
+@log_action_to_db(transactional=True)
+def create_tasks_bulk():
+    """
+    Create many tasks at once
+    ---
+    tags:
+      - Tasks
+    security:
+      - bearerAuth: []
+    description: All-or-nothing. Caches and progress are refreshed once per project and one audit entry is written.
+    requestBody:
+      required: true
+      content:
+        application/json:
+          schema:
+            type: object
+            required:
+              - tasks
+            properties:
+              tasks:
+                type: array
+                maxItems: 1000
+                items:
+                  type: object
+                  required:
+                    - title
+                    - description
+                    - project_id
+                  properties:
+                    title:
+                      type: string
+                    description:
+                      type: string
+                    project_id:
+                      type: string
+                    assignee_id:
+                      type: string
+    responses:
+      201:
+        description: Tasks created, in request order
+      401:
+        description: Not authenticated
+      403:
+        description: Requester is neither owner nor member of one of the projects (admins bypass)
+      404:
+        description: Project not found
+      422:
+        description: Invalid payload or completed project
+    """
+    try:
+        items = (request.get_json() or {}).get("tasks")
+        requester_id = get_jwt_identity()
+        tasks = TaskService.create_tasks(requester_id, items)
+        project_ids = sorted({task.project_id for task in tasks})
+        LogService.log_action(
+            action=ActionType.TASK_CREATED,
+            user_id=requester_id,
+            resource_type="task",
+            details={"bulk": True, "count": len(tasks), "project_ids": project_ids, "task_ids": [task.id for task in tasks]},
+        )
+        LogService.log_info("Tasks created in bulk", context={"count": len(tasks), "project_ids": project_ids})
+        return created(data=[task.to_dict() for task in tasks])
+    except ValueError as e:
+        LogService.log_error("Failed to create tasks in bulk", error=e)
+        return not_found(str(e)) if "not found" in str(e).lower() else unprocessable_entity(str(e))
+    except PermissionError as e:
+        LogService.log_error("Permission denied to create tasks in bulk", error=e)
+        return forbidden(str(e))
+
+
+@tasks_bp.patch("/bulk/status")
+@jwt_required()
+@log_action_to_db(transactional=True)
+def update_status_bulk():
+    """
+    Update the status of many tasks at once
+    ---
+    tags:
+      - Tasks
+    security:
+      - bearerAuth: []
+    description: All-or-nothing; the requester must be the assignee of every task.
+    requestBody:
+      required: true
+      content:
+        application/json:
+          schema:
+            type: object
+            required:
+              - tasks
+            properties:
+              tasks:
+                type: array
+                maxItems: 1000
+                items:
+                  type: object
+                  required:
+                    - id
+                    - status
+                  properties:
+                    id:
+                      type: string
+                    status:
+                      type: string
+                      enum: [pending, in_progress, done, awaiting_reassignment]
+                    version:
+                      type: integer
+                      description: Reject the whole batch if this task changed since this version
+    responses:
+      200:
+        description: Updated tasks, in request order
+      401:
+        description: Not authenticated
+      403:
+        description: Requester is not the assignee of every task
+      404:
+        description: Task not found
+      412:
+        description: A task version is stale
+      422:
+        description: Invalid payload
+    """
+    try:
+        items = (request.get_json() or {}).get("tasks")
+        requester_id = get_jwt_identity()
+        tasks = TaskService.update_statuses(requester_id, items)
+        LogService.log_action(
+            action=ActionType.TASK_UPDATED,
+            user_id=requester_id,
+            resource_type="task",
+            details={"bulk": True, "count": len(tasks), "changes": {task.id: task.status.value for task in tasks}},
+        )
+        LogService.log_info("Task statuses updated in bulk", context={"count": len(tasks)})
+        return success(data=[task.to_dict() for task in tasks])
+    except ValueError as e:
+        LogService.log_error("Failed to update tasks in bulk", error=e)
+        return not_found(str(e)) if "not found" in str(e).lower() else unprocessable_entity(str(e))
+    except PermissionError as e:
+        LogService.log_error("Permission denied to update tasks in bulk", error=e)
+        return forbidden(str(e))
 
 
 @tasks_bp.get("/project/<project_id>")
 @jwt_required()
+@authorize(project_arg="project_id")
 def list_tasks(project_id: str):
     """
     List project tasks
@@ -100,6 +256,32 @@ def list_tasks(project_id: str):
         schema:
           type: string
         description: Project ID
+      - in: query
+        name: status
+        schema:
+          type: string
+          enum: [pending, in_progress, done, awaiting_reassignment]
+      - in: query
+        name: assignee_id
+        schema:
+          type: string
+      - in: query
+        name: fields
+        schema:
+          type: string
+          example: id,title,status
+        description: Comma-separated subset of fields to return
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          maximum: 500
+        description: Page size. With limit or cursor the response is {items, next_cursor} instead of a plain array
+      - in: query
+        name: cursor
+        schema:
+          type: string
+        description: next_cursor from the previous page
     responses:
       200:
         description: List of tasks
@@ -122,14 +304,40 @@ def list_tasks(project_id: str):
                     type: string
                   assignee_id:
                     type: string
+      304:
+        description: Not modified (If-None-Match matches the current ETag)
       401:
         description: Not authenticated
+      403:
+        description: Requester is neither owner nor member of the project (admins bypass)
+      404:
+        description: Project not found
+      422:
+        description: Invalid filter, field or cursor
     """
-    return success(data=[t.to_dict() for t in TaskService.list_tasks(project_id, get_jwt_identity())])
+    requester_id = get_jwt_identity()
+
+    def build():
+        try:
+            fields = parse_fields(request.args.get("fields"), TASK_FIELDS)
+            status = TaskStatus(request.args["status"]) if request.args.get("status") else None
+            assignee_id = request.args.get("assignee_id") or None
+            if "limit" in request.args or "cursor" in request.args:
+                tasks, next_cursor = TaskService.list_tasks_page(
+                    project_id, requester_id, status, assignee_id, request.args.get("cursor"), parse_limit(request.args.get("limit"))
+                )
+                return success(data={"items": [select_fields(t.to_dict(), fields) for t in tasks], "next_cursor": next_cursor})
+            tasks = TaskService.list_tasks(project_id, requester_id, status, assignee_id)
+        except ValueError as e:
+            return unprocessable_entity(str(e))
+        return success(data=[select_fields(t.to_dict(), fields) for t in tasks])
+
+    return conditional(f"tasks:{project_id}", build)
 
 
 @tasks_bp.patch("/<task_id>/status")
 @jwt_required()
+@log_action_to_db(transactional=True)
 def update_status(task_id: str):
     """
     Update task status
@@ -185,11 +393,13 @@ def update_status(task_id: str):
         description: Only the assignee can update the task
       404:
         description: Task not found
+      412:
+        description: If-Match does not match the current version
     """
     try:
         data = request.get_json() or {}
         requester_id = get_jwt_identity()
-        task = TaskService.update_status(task_id, requester_id, data.get("status"))
+        task = TaskService.update_status(task_id, requester_id, data.get("status"), if_match_version())
         LogService.log_action(action=ActionType.TASK_UPDATED, user_id=requester_id, resource_type="task", resource_id=task_id, details={"new_status": data.get("status")})
         LogService.log_info("Task status updated", context={"task_id": task_id, "new_status": data.get("status")})
         return success(data=task.to_dict())
@@ -203,6 +413,7 @@ def update_status(task_id: str):
 
 @tasks_bp.patch("/<task_id>/assignee")
 @jwt_required()
+@log_action_to_db(transactional=True)
 def reassign_task(task_id: str):
     """
     Reassign task to a new assignee
@@ -260,12 +471,14 @@ def reassign_task(task_id: str):
         description: Only admin, manager or project owner can reassign tasks
       404:
         description: Task or project not found
+      412:
+        description: If-Match does not match the current version
     """
     try:
         data = request.get_json() or {}
         requester_id = get_jwt_identity()
         new_assignee_id = data.get("assignee_id")
-        task = TaskService.reassign_task(task_id, requester_id, new_assignee_id)
+        task = TaskService.reassign_task(task_id, requester_id, new_assignee_id, if_match_version())
         LogService.log_action(action=ActionType.TASK_UPDATED, user_id=requester_id, resource_type="task", resource_id=task_id, details={"reassigned_to": new_assignee_id})
         LogService.log_info("Task reassigned successfully", context={"task_id": task_id, "new_assignee_id": new_assignee_id})
         return success(data=task.to_dict())
@@ -1,14 +1,40 @@
 from .repository import TaskRepository
+from .stats import ProjectTaskStatsRepository
+from .broadcaster import progress_broadcaster
 from ..project.repository import ProjectRepository
 from ..user.repository import UserRepository
 from .models import Task, TaskStatus
+from .dto import TaskDTO
 from ..project.models import ProjectStatus
-from ..extensions import socketio
 from ..project.service import ProjectService
 from ..cache import cache
+from ..unit_of_work import after_commit
+from ..pagination import decode_keyset_cursor, paginate
 from ..user.models import UserRole
 
 
+BULK_MAX_TASKS = 1000
+
+
+def _validate_bulk(items, required: tuple[str, ...]) -> None:
+    if not isinstance(items, list) or not items:
+        raise ValueError("tasks must be a non-empty list")
+    if len(items) > BULK_MAX_TASKS:
+        raise ValueError(f"at most {BULK_MAX_TASKS} tasks per request")
+    for index, item in enumerate(items):
+        missing = [field for field in required if not isinstance(item, dict) or not item.get(field)]
+        if missing:
+            raise ValueError(f"tasks[{index}] is missing {', '.join(missing)}")
+        not_strings = [field for field in required if not isinstance(item[field], str)]
+        if not_strings:
+            raise ValueError(f"tasks[{index}] fields must be strings: {', '.join(not_strings)}")
+        if not isinstance(item.get("assignee_id"), (str, type(None))):
+            raise ValueError(f"tasks[{index}].assignee_id must be a string or null")
+        version = item.get("version")
+        if version is not None and (not isinstance(version, int) or isinstance(version, bool)):
+            raise ValueError(f"tasks[{index}].version must be an integer")
+
+
 class TaskService:
     @staticmethod
     def create_task(requester_id: str, data: dict) -> Task:
@@ -17,6 +43,7 @@ class TaskService:
             raise ValueError("project not found")
         if project.status == ProjectStatus.COMPLETED:
             raise ValueError("cannot add tasks to completed projects")
+        TaskService._require_project_access(requester_id, {project.id})
         task = Task(
             title=data.get("title"),
             description=data.get("description"),
@@ -24,41 +51,121 @@ class TaskService:
             assignee_id=data.get("assignee_id"),
         )
         task = TaskRepository.create(task)
-        cache.delete(f"tasks:{project.id}")
-        TaskService.broadcast_progress(project.id)
+        TaskService._after_task_change(project.id)
         return task
 
     @staticmethod
-    def list_tasks(project_id: str, requester_id: str) -> list[Task]:
+    def create_tasks(requester_id: str, items: list[dict]) -> list[Task]:
+        """Create many tasks in one flush; caches and progress are refreshed once per project."""
+        _validate_bulk(items, ("title", "description", "project_id"))
+        project_ids = {item["project_id"] for item in items}
+        projects = {project.id: project for project in ProjectRepository.get_many(list(project_ids))}
+        missing = sorted(project_ids - projects.keys())
+        if missing:
+            raise ValueError(f"project not found: {', '.join(missing)}")
+        if any(project.status == ProjectStatus.COMPLETED for project in projects.values()):
+            raise ValueError("cannot add tasks to completed projects")
+        TaskService._require_project_access(requester_id, project_ids)
+        tasks = TaskRepository.create_many([
+            Task(
+                title=item["title"],
+                description=item["description"],
+                project_id=item["project_id"],
+                assignee_id=item.get("assignee_id"),
+            )
+            for item in items
+        ])
+        for project_id in project_ids:
+            TaskService._after_task_change(project_id)
+        return tasks
+
+    @staticmethod
+    def _require_project_access(requester_id: str, project_ids: set[str]) -> None:
+        """Owner or member of every project; the requester is only loaded to check for the admin bypass."""
+        denied = sorted(project_id for project_id in project_ids if not ProjectService.is_member(project_id, requester_id))
+        if not denied:
+            return
+        requester = UserRepository.get_by_id(requester_id)
+        if not requester or requester.role != UserRole.ADMIN:
+            raise PermissionError(f"not a member of project: {', '.join(denied)}")
+
+    @staticmethod
+    def update_statuses(requester_id: str, items: list[dict]) -> list[Task]:
+        """Apply many status changes all-or-nothing; each item may carry the `version` it was based on."""
+        _validate_bulk(items, ("id", "status"))
+        task_ids = [item["id"] for item in items]
+        if len(set(task_ids)) != len(task_ids):
+            raise ValueError("each task may appear only once")
+        statuses = [TaskStatus(item["status"]) for item in items]
+        tasks = {task.id: task for task in TaskRepository.get_many(task_ids)}
+        missing = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing:
+            raise ValueError(f"task not found: {', '.join(missing)}")
+        foreign = [task_id for task_id in task_ids if tasks[task_id].assignee_id != requester_id]
+        if foreign:
+            raise PermissionError(f"only assignee can change status: {', '.join(foreign)}")
+        for item, status in zip(items, statuses):
+            task = tasks[item["id"]]
+            task.check_version(item.get("version"))
+            task.status = status
+            if status == TaskStatus.AWAITING_REASSIGNMENT:
+                task.assignee_id = None
+        TaskRepository.update_many(list(tasks.values()))
+        for project_id in {task.project_id for task in tasks.values()}:
+            ProjectService.recompute_status_if_completed(project_id)
+            TaskService._after_task_change(project_id)
+        return [tasks[task_id] for task_id in task_ids]
+
+    @staticmethod
+    def list_tasks(
+        project_id: str, requester_id: str, status: TaskStatus | None = None, assignee_id: str | None = None
+    ) -> list[TaskDTO]:
         cache_key = f"tasks:{project_id}"
-        cached = cache.get(cache_key)
-        if cached:
-            import json
-            tasks_data = json.loads(cached)
-            return [Task(**{**t, "status": TaskStatus(t["status"])}) for t in tasks_data]
-        tasks = TaskRepository.list_for_project(project_id)
-        import json
-        cache.set(cache_key, json.dumps([t.to_dict() for t in tasks]), ex=60)
+        tasks = cache.get_models(cache_key, TaskDTO)
+        if tasks is None:
+            tasks = [TaskDTO.from_dict(t.to_dict()) for t in TaskRepository.list_for_project(project_id)]
+            cache.set_models(cache_key, tasks, ex=60)
+        if status:
+            tasks = [t for t in tasks if t.status == status]
+        if assignee_id:
+            tasks = [t for t in tasks if t.assignee_id == assignee_id]
         return tasks
 
     @staticmethod
-    def update_status(task_id: str, requester_id: str, status: str) -> Task:
+    def list_tasks_page(
+        project_id: str,
+        requester_id: str,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[TaskDTO], str | None]:
+        tasks = TaskRepository.list_for_project(
+            project_id, status=status, assignee_id=assignee_id, after=decode_keyset_cursor(cursor), limit=limit + 1
+        )
+        tasks, next_cursor = paginate(tasks, limit)
+        return [TaskDTO.from_dict(t.to_dict()) for t in tasks], next_cursor
+
+    @staticmethod
+    def update_status(task_id: str, requester_id: str, status: str, expected_version: int | None = None) -> Task:
         task = TaskRepository.get_by_id(task_id)
         if not task:
             raise ValueError("not found")
         if task.assignee_id != requester_id:
             raise PermissionError("only assignee can change status")
+        task.check_version(expected_version)
         task.status = TaskStatus(status)
         if task.status == TaskStatus.AWAITING_REASSIGNMENT:
             task.assignee_id = None
         task = TaskRepository.update(task)
-        cache.delete(f"tasks:{task.project_id}")
         ProjectService.recompute_status_if_completed(task.project_id)
-        TaskService.broadcast_progress(task.project_id)
+        TaskService._after_task_change(task.project_id)
         return task
 
     @staticmethod
-    def reassign_task(task_id: str, requester_id: str, new_assignee_id: str | None) -> Task:
+    def reassign_task(
+        task_id: str, requester_id: str, new_assignee_id: str | None, expected_version: int | None = None
+    ) -> Task:
         task = TaskRepository.get_by_id(task_id)
         if not task:
             raise ValueError("not found")
@@ -73,27 +180,25 @@ class TaskService:
         is_owner = project.owner_id == requester_id
         if not (is_admin or is_manager or is_owner):
             raise PermissionError("only admin, manager or project owner can reassign tasks")
+        task.check_version(expected_version)
         if new_assignee_id:
             new_assignee = UserRepository.get_by_id(new_assignee_id)
             if not new_assignee:
                 raise ValueError("new assignee not found")
-            is_project_member = new_assignee_id in [m.id for m in project.members] or new_assignee_id == project.owner_id
-            if not is_project_member:
+            if not ProjectService.is_member(project.id, new_assignee_id):
                 raise ValueError("new assignee must be a project member or owner")
         task.assignee_id = new_assignee_id
         if task.status == TaskStatus.AWAITING_REASSIGNMENT and new_assignee_id:
             task.status = TaskStatus.PENDING
         task = TaskRepository.update(task)
-        cache.delete(f"tasks:{task.project_id}")
-        TaskService.broadcast_progress(task.project_id)
+        TaskService._after_task_change(task.project_id)
         return task
 
+    @staticmethod
+    def _after_task_change(project_id: str) -> None:
+        after_commit(lambda: cache.delete(f"tasks:{project_id}"))
+        after_commit(lambda: TaskService.broadcast_progress(project_id))
+
     @staticmethod
     def broadcast_progress(project_id: str) -> None:
-        tasks = TaskRepository.list_for_project(project_id)
-        if not tasks:
-            percent = 0
-        else:
-            done = len([t for t in tasks if t.status == TaskStatus.DONE])
-            percent = int((done / len(tasks)) * 100)
-        socketio.emit("project_progress", {"project_id": project_id, "percent": percent})
+        progress_broadcaster.publish(project_id, ProjectTaskStatsRepository.get(project_id).percent_done)
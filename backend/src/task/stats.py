@@ -0,0 +1,95 @@
+from collections import Counter, defaultdict
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..extensions import db
+from ..unit_of_work import commit
+from ..project.models import Project
+from .models import Task, TaskStatus, ProjectTaskStats
+from .repository import TaskRepository
+from .dto import TaskStatusCounts
+
+
+STATUS_COLUMNS = [status.value for status in TaskStatus]
+
+
+class ProjectTaskStatsRepository:
+    @staticmethod
+    def get(project_id: str) -> TaskStatusCounts:
+        row = db.session.execute(
+            select(ProjectTaskStats.__table__).where(ProjectTaskStats.project_id == project_id)
+        ).mappings().first()
+        if row is None:
+            return ProjectTaskStatsRepository.rebuild(project_id)
+        return TaskStatusCounts(total=row["total"], by_status={s: row[s] for s in STATUS_COLUMNS})
+
+    @staticmethod
+    def rebuild(project_id: str) -> TaskStatusCounts:
+        """Backfill the counters of a project created before the stats table existed."""
+        counts = TaskRepository.status_counts(project_id)
+        try:
+            with db.session.begin_nested():
+                db.session.execute(
+                    insert(ProjectTaskStats.__table__).values(
+                        project_id=project_id,
+                        total=counts.total,
+                        **counts.by_status,
+                    )
+                )
+            commit()
+        except IntegrityError:
+            pass
+        return counts
+
+
+def _task_deltas(session: Session) -> dict[str, Counter]:
+    deltas: dict[str, Counter] = defaultdict(Counter)
+
+    for obj in session.new:
+        if isinstance(obj, Task) and obj.deleted_at is None:
+            deltas[obj.project_id]["total"] += 1
+            deltas[obj.project_id][TaskStatus(obj.status or TaskStatus.PENDING).value] += 1
+
+    for obj in session.dirty:
+        if not isinstance(obj, Task):
+            continue
+        state = inspect(obj)
+        status_history = state.attrs.status.history
+        deleted_history = state.attrs.deleted_at.history
+        if not status_history.has_changes() and not deleted_history.has_changes():
+            continue
+        old_status = status_history.deleted[0] if status_history.deleted else obj.status
+        was_live = (deleted_history.deleted[0] if deleted_history.deleted else obj.deleted_at) is None
+        if was_live:
+            deltas[obj.project_id]["total"] -= 1
+            deltas[obj.project_id][TaskStatus(old_status).value] -= 1
+        if obj.deleted_at is None:
+            deltas[obj.project_id]["total"] += 1
+            deltas[obj.project_id][TaskStatus(obj.status).value] += 1
+
+    for obj in session.deleted:
+        if isinstance(obj, Task) and obj.deleted_at is None:
+            deltas[obj.project_id]["total"] -= 1
+            deltas[obj.project_id][TaskStatus(obj.status).value] -= 1
+
+    return deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_task_stats(session: Session, flush_context) -> None:
+    new_project_ids = [obj.id for obj in session.new if isinstance(obj, Project)]
+    deltas = _task_deltas(session)
+    if not new_project_ids and not deltas:
+        return
+
+    connection = session.connection()
+    table = ProjectTaskStats.__table__
+    if new_project_ids:
+        connection.execute(
+            insert(table),
+            [{"project_id": pid, "total": 0, **{s: 0 for s in STATUS_COLUMNS}} for pid in new_project_ids],
+        )
+    for project_id, counter in deltas.items():
+        values = {column: table.c[column] + delta for column, delta in counter.items() if delta}
+        if values:
+            connection.execute(update(table).where(table.c.project_id == project_id).values(**values))
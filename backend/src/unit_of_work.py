@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from flask import g, has_app_context
+from sqlalchemy.orm.exc import StaleDataError
+from .extensions import db
+from .versioning import StaleVersionError
+
+
+class UnitOfWork:
+    def __init__(self) -> None:
+        self.discard = False
+        self.callbacks: list[Callable[[], None]] = []
+
+
+def current() -> UnitOfWork | None:
+    return g.get("unit_of_work") if has_app_context() else None
+
+
+def commit() -> None:
+    """Commit now, or only flush when an enclosing unit of work commits at the end."""
+    try:
+        if current():
+            db.session.flush()
+        else:
+            db.session.commit()
+    except StaleDataError as e:
+        # A concurrent writer bumped the version between our read and this UPDATE.
+        if not current():
+            db.session.rollback()
+        raise StaleVersionError(str(e)) from e
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """Run side effects (cache invalidation, broadcasts) once the data they describe is committed."""
+    uow = current()
+    if uow:
+        uow.callbacks.append(callback)
+    else:
+        callback()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    outer = current()
+    if outer:
+        yield outer
+        return
+
+    uow = g.unit_of_work = UnitOfWork()
+    try:
+        yield uow
+        if uow.discard:
+            db.session.rollback()
+        else:
+            db.session.commit()
+    except StaleDataError as e:
+        db.session.rollback()
+        raise StaleVersionError(str(e)) from e
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        g.pop("unit_of_work", None)
+
+    if not uow.discard:
+        for callback in uow.callbacks:
+            callback()
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from .models import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class UserDTO:
+    """Read-only user snapshot rebuilt from cached payloads."""
+
+    id: str
+    name: str
+    email: str
+    role: UserRole
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UserDTO":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            email=data["email"],
+            role=UserRole(data["role"]),
+        )
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "name": self.name, "email": self.email, "role": self.role.value}
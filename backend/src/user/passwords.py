@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from passlib.hash import bcrypt
+
+
+class HasherSaturatedError(Exception):
+    """Raised when every hashing worker is busy and the wait queue is full."""
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.using(rounds=rounds).hash(password)
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    return bcrypt.verify(password, password_hash)
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded process pool so a login burst cannot monopolize the request workers."""
+
+    def __init__(self) -> None:
+        self.rounds = 12
+        self.workers = os.cpu_count() or 1
+        self.queue_size = 32
+        self.enabled = False
+        self.rejected = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_pid: int | None = None
+
+    def init_app(self, app) -> None:
+        self.rounds = app.config.get("PASSWORD_HASH_ROUNDS", 12)
+        self.workers = app.config.get("PASSWORD_HASH_WORKERS") or os.cpu_count() or 1
+        self.queue_size = app.config.get("PASSWORD_HASH_QUEUE_SIZE", 32)
+        self.enabled = bool(app.config.get("PASSWORD_HASH_POOL")) and not app.config.get("TESTING")
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password: str | None, password_hash: str) -> bool:
+        if not password or not password_hash:
+            return False
+        try:
+            return self._run(_verify, password, password_hash)
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return bcrypt.using(rounds=self.rounds).needs_update(password_hash)
+
+    @property
+    def depth(self) -> int:
+        return self._in_flight
+
+    def stats(self) -> dict:
+        """Per-process pool load: hashes running or waiting, how many of those wait for a worker, and rejections."""
+        with self._lock:
+            in_flight, rejected = self._in_flight, self.rejected
+        return {
+            "enabled": self.enabled,
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "queued": max(0, in_flight - self.workers),
+            "capacity": self.workers + self.queue_size,
+            "rejected": rejected,
+        }
+
+    def _run(self, fn, *args):
+        if not self.enabled:
+            return fn(*args)
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise HasherSaturatedError("password hashing is saturated, retry shortly")
+            self._in_flight += 1
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # One pool per process: a pool inherited through fork would point at the parent's workers.
+        if self._executor_pid == os.getpid():
+            return self._executor
+        with self._lock:
+            if self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._executor_pid = os.getpid()
+        return self._executor
+
+
+password_hasher = PasswordHasher()
@@ -1,6 +1,8 @@
-from passlib.hash import bcrypt
 from ..extensions import db
+from ..unit_of_work import commit
+from ..request_scope import get_or_load
 from .models import User, UserRole
+from .passwords import password_hasher
 from sqlalchemy.exc import IntegrityError
 
 
@@ -11,11 +13,11 @@ class UserRepository:
             user = User(
                 name=name,
                 email=email,
-                password_hash=bcrypt.hash(password),
+                password_hash=password_hasher.hash(password),
                 role=UserRole(role) if role else UserRole.MEMBER,
             )
             db.session.add(user)
-            db.session.commit()
+            commit()
             return user
         except IntegrityError as e:
             db.session.rollback()
@@ -30,7 +32,11 @@ class UserRepository:
 
     @staticmethod
     def get_by_id(user_id: str) -> User | None:
-        return User.query.filter(User.deleted_at.is_(None)).filter_by(id=user_id).first()
+        return get_or_load(
+            User,
+            user_id,
+            lambda: User.query.filter(User.deleted_at.is_(None)).filter_by(id=user_id).first(),
+        )
 
     @staticmethod
     def list_all() -> list[User]:
@@ -42,4 +48,4 @@ class UserRepository:
         if not user:
             return
         user.soft_delete()
-        db.session.commit()
+        commit()
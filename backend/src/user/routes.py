@@ -2,9 +2,10 @@ from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from ..access_control.decorators import require_roles
 from .service import UserService
-from ..http_responses.responses import success, not_found, no_content, unprocessable_entity, forbidden
+from ..http_responses.responses import conditional, success, not_found, no_content, unprocessable_entity, forbidden
 from ..log.service import LogService
 from ..log.models import ActionType
+from ..log.decorator import log_action_to_db
 
 
 users_bp = Blueprint("users", __name__)
@@ -39,12 +40,14 @@ def list_users():
                     type: string
                   role:
                     type: string
+      304:
+        description: Not modified (If-None-Match matches the current ETag)
       401:
         description: Not authenticated
       403:
         description: Insufficient permissions (requires Admin or Manager)
     """
-    return success(data=[u.to_dict() for u in UserService.list_users()])
+    return conditional("users:all", lambda: success(data=[u.to_dict() for u in UserService.list_users()]))
 
 
 @users_bp.get("/<user_id>")
@@ -84,6 +87,8 @@ def get_user(user_id: str):
                       type: string
                     role:
                       type: string
+      304:
+        description: Not modified (If-None-Match matches the current ETag)
       401:
         description: Not authenticated
       403:
@@ -91,14 +96,18 @@ def get_user(user_id: str):
       404:
         description: User not found
     """
-    user = UserService.get_by_id(user_id)
-    if not user:
-        return not_found()
-    return success(data=user.to_dict())
+    def build():
+        user = UserService.get_by_id(user_id)
+        if not user:
+            return not_found()
+        return success(data=user.to_dict())
+
+    return conditional(f"user:{user_id}", build)
 
 
 @users_bp.patch("/<user_id>")
 @jwt_required()
+@log_action_to_db(transactional=True)
 def update_user(user_id: str):
     """
     Update user
@@ -196,6 +205,7 @@ def update_user(user_id: str):
 @users_bp.delete("/<user_id>")
 @jwt_required()
 @require_roles(["admin"])  
+@log_action_to_db(transactional=True)
 def delete_user(user_id: str):
     """
     Delete user (soft delete)
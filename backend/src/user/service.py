@@ -1,11 +1,20 @@
-from passlib.hash import bcrypt
+import hashlib
+from flask import current_app
 from .repository import UserRepository
 from ..project.repository import ProjectRepository
+from ..project.membership import ProjectMembership
+from ..auth.blocklist import token_blocklist
 from ..task.repository import TaskRepository
 from .models import User, UserRole
+from .passwords import HasherSaturatedError, password_hasher
+from .dto import UserDTO
 from ..task.models import TaskStatus
-from ..extensions import db
 from ..cache import cache
+from ..unit_of_work import commit, after_commit
+
+
+def _unknown_email_key(email: str) -> str:
+    return f"auth:unknown:{hashlib.sha1(email.encode()).hexdigest()}"
 
 
 class UserService:
@@ -13,7 +22,7 @@ class UserService:
     def create_user(name: str, email: str, password: str, role: str | None = None) -> User:
         try:
             user = UserRepository.create(name=name, email=email, password=password, role=role)
-            cache.delete("users:all")
+            after_commit(lambda: cache.delete_many(["users:all", _unknown_email_key(email)]))
             return user
         except Exception as e:
             from sqlalchemy.exc import IntegrityError
@@ -23,37 +32,47 @@ class UserService:
 
     @staticmethod
     def authenticate(email: str, password: str) -> User | None:
+        if not email or not password:
+            return None
+        # Remembering misses keeps bursts against unknown emails off the database entirely.
+        negative_key = _unknown_email_key(email)
+        if cache.get(negative_key):
+            return None
         user = UserRepository.get_by_email(email)
-        if user and bcrypt.verify(password, user.password_hash):
-            return user
-        return None
+        if not user:
+            cache.set(negative_key, "1", ex=current_app.config.get("UNKNOWN_EMAIL_CACHE_TTL", 300))
+            return None
+        if not password_hasher.verify(password, user.password_hash):
+            return None
+        if password_hasher.needs_rehash(user.password_hash):
+            try:
+                user.password_hash = password_hasher.hash(password)
+                commit()
+            except HasherSaturatedError:
+                pass
+        return user
 
     @staticmethod
-    def get_by_id(user_id: str) -> User | None:
+    def get_by_id(user_id: str) -> UserDTO | None:
         cache_key = f"user:{user_id}"
-        cached = cache.get(cache_key)
+        cached = cache.get_model(cache_key, UserDTO)
         if cached:
-            import json
-            data = json.loads(cached)
-            data["role"] = UserRole(data["role"])
-            return User(**data)
+            return cached
         user = UserRepository.get_by_id(user_id)
-        if user:
-            import json
-            cache.set(cache_key, json.dumps(user.to_dict()), ex=60)
-        return user
+        if not user:
+            return None
+        dto = UserDTO.from_dict(user.to_dict())
+        cache.set_model(cache_key, dto, ex=60)
+        return dto
 
     @staticmethod
-    def list_users() -> list[User]:
+    def list_users() -> list[UserDTO]:
         cache_key = "users:all"
-        cached = cache.get(cache_key)
-        if cached:
-            import json
-            users_data = json.loads(cached)
-            return [User(**{**u, "role": UserRole(u["role"])}) for u in users_data]
-        users = UserRepository.list_all()
-        import json
-        cache.set(cache_key, json.dumps([u.to_dict() for u in users]), ex=60)
+        cached = cache.get_models(cache_key, UserDTO)
+        if cached is not None:
+            return cached
+        users = [UserDTO.from_dict(u.to_dict()) for u in UserRepository.list_all()]
+        cache.set_models(cache_key, users, ex=60)
         return users
 
     @staticmethod
@@ -67,9 +86,11 @@ class UserService:
             user.name = data["name"]
         if "email" in data:
             user.email = data["email"]
-        db.session.commit()
-        cache.delete(f"user:{user_id}")
-        cache.delete("users:all")
+        commit()
+        keys = [f"user:{user_id}", "users:all"]
+        if "email" in data:
+            keys.append(_unknown_email_key(data["email"]))
+        after_commit(lambda: cache.delete_many(keys))
         return user
 
     @staticmethod
@@ -78,14 +99,28 @@ class UserService:
         if not user:
             return
         
+        member_of = ProjectRepository.project_ids_for_user(user_id)
+        affected_user_ids = {user_id}
+        owned_project_ids = set()
         for project in list(user.projects_owned):
+            affected_user_ids.update(m.id for m in project.members)
+            owned_project_ids.add(project.id)
             project.owner_id = None
+        task_project_ids = set()
         for task in list(user.tasks):
+            task_project_ids.add(task.project_id)
             task.status = TaskStatus.AWAITING_REASSIGNMENT
             task.assignee_id = None
         
         user.soft_delete()
-        db.session.commit()
+        commit()
         
-        cache.delete(f"user:{user_id}")
-        cache.delete("users:all")
+        after_commit(lambda: cache.delete_many([
+            f"user:{user_id}",
+            "users:all",
+            *(f"projects:{affected_id}" for affected_id in affected_user_ids),
+            *(f"project:{project_id}" for project_id in owned_project_ids),
+            *(f"tasks:{project_id}" for project_id in task_project_ids),
+        ]))
+        ProjectMembership.user_deleted(user_id, member_of)
+        after_commit(lambda: token_blocklist.revoke_user(user_id))
@@ -0,0 +1,37 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+
+class StaleVersionError(Exception):
+    """Raised when a write was based on a version of the row that is no longer current."""
+
+
+class VersionedMixin:
+    """Mixin for models with an updated_at timestamp and an optimistic-locking version counter."""
+    
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1
+    )
+    
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        # The ORM bumps the counter on every UPDATE and adds "WHERE version = <loaded>" to it.
+        return {"version_id_col": cls.__table__.c.version}
+    
+    def touch(self) -> None:
+        """Force an UPDATE (and a version bump) for changes that live outside the row, e.g. collections."""
+        self.updated_at = datetime.utcnow()
+    
+    def check_version(self, expected: int | None) -> None:
+        """Reject the write if the caller edited a different version than the one loaded."""
+        if expected is not None and expected != self.version:
+            raise StaleVersionError(f"version {expected} is stale, current version is {self.version}")
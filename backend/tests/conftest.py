@@ -1,3 +1,4 @@
+import time
 import pytest
 from src.factory import create_app
 from src.settings import AppConfig
@@ -10,11 +11,23 @@ class TestConfig(AppConfig):
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     TESTING = True
     REDIS_URL = "redis://localhost:6379/15"
+    PASSWORD_HASH_ROUNDS = 4
+    PROGRESS_BROADCAST_WINDOW_MS = 0
+
+
+MOCKED_CACHE_METHODS = (
+    "get", "set", "delete", "delete_many",
+    "get_model", "set_model", "get_models", "set_models", "version", "hit",
+    "get_set", "set_set", "set_contains",
+    "add_expiring", "live_members", "is_live_member",
+)
 
 
 class MockCache:
     def __init__(self):
         self._store = {}
+        self._generations = {}
+        self._hits = {}
     
     def init_app(self, app):
         pass
@@ -25,6 +38,63 @@ class MockCache:
     def set(self, key: str, value: str, ex: int | None = None):
         self._store[key] = value
         return True
+    
+    def delete(self, key: str):
+        self._generations[key] = self._generations.get(key, 0) + 1
+        return 1 if self._store.pop(key, None) is not None else 0
+    
+    def delete_many(self, keys: list[str]):
+        return sum(self.delete(key) for key in set(keys))
+    
+    def get_model(self, key: str, model_cls):
+        data = self._store.get(key)
+        return model_cls.from_dict(data) if isinstance(data, dict) else None
+    
+    def set_model(self, key: str, model, ex: int | None = None):
+        self._store[key] = model.to_dict()
+        return True
+    
+    def get_models(self, key: str, model_cls):
+        data = self._store.get(key)
+        return [model_cls.from_dict(item) for item in data] if isinstance(data, list) else None
+    
+    def set_models(self, key: str, models, ex: int | None = None):
+        self._store[key] = [m.to_dict() for m in models]
+        return True
+    
+    def hit(self, key: str, window: float):
+        now = time.monotonic()
+        hits = [t for t in self._hits.get(key, []) if t > now - window] + [now]
+        self._hits[key] = hits
+        return len(hits)
+    
+    def get_set(self, key: str):
+        data = self._store.get(key)
+        return set(data) if isinstance(data, set) else None
+    
+    def set_set(self, key: str, members, version: str, ex: int | None = None):
+        if version != self.version(key):
+            return 0
+        self._store[key] = set(members)
+        return 1
+    
+    def set_contains(self, key: str, member: str):
+        data = self._store.get(key)
+        return member in data if isinstance(data, set) else None
+    
+    def add_expiring(self, key: str, members: dict):
+        data = self._store.setdefault(key, {})
+        data.update(members)
+        return len(members)
+    
+    def live_members(self, key: str):
+        return {m: exp for m, exp in self._store.get(key, {}).items() if exp > time.time()}
+    
+    def is_live_member(self, key: str, member: str):
+        return self._store.get(key, {}).get(member, 0) > time.time()
+    
+    def version(self, key: str):
+        return f"gen:{key}:{self._generations.get(key, 0)}"
 
 
 @pytest.fixture()
@@ -34,10 +104,9 @@ def app():
     mock_cache_instance = MockCache()
     
     cache.client = None
-    original_get = cache.get
-    original_set = cache.set
-    cache.get = mock_cache_instance.get
-    cache.set = mock_cache_instance.set
+    original_methods = {name: getattr(cache, name) for name in MOCKED_CACHE_METHODS}
+    for name in MOCKED_CACHE_METHODS:
+        setattr(cache, name, getattr(mock_cache_instance, name))
     
     app = create_app(TestConfig())
     
@@ -48,8 +117,8 @@ def app():
         db.drop_all()
     
     cache.client = None
-    cache.get = original_get
-    cache.set = original_set
+    for name, method in original_methods.items():
+        setattr(cache, name, method)
 
 
 @pytest.fixture()
@@ -0,0 +1,84 @@
+import uuid
+from datetime import datetime
+from src.log.models import Log, ActionType
+from src.log.writer import AuditLogWriter
+
+
+def make_entry(action: ActionType = ActionType.LOGIN) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "action": action,
+        "user_id": "user-1",
+        "resource_type": None,
+        "resource_id": None,
+        "details": None,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def test_audit_log_writer_flushes_in_batches(app):
+    writer = AuditLogWriter()
+    writer.init_app(app)
+    writer.batch_size = 2
+    
+    for _ in range(5):
+        assert writer.enqueue(make_entry())
+    assert Log.query.count() == 0
+    
+    writer.flush()
+    
+    assert writer.depth == 0
+    assert Log.query.filter_by(action=ActionType.LOGIN).count() == 5
+
+
+def test_audit_log_writer_drops_when_full(app):
+    app.config["AUDIT_LOG_QUEUE_SIZE"] = 1
+    app.config["AUDIT_LOG_OVERFLOW"] = "drop"
+    writer = AuditLogWriter()
+    writer.init_app(app)
+    
+    assert writer.enqueue(make_entry())
+    assert not writer.enqueue(make_entry())
+    assert writer.dropped == 1
+
+
+def test_transactional_route_commits_business_change_and_audit_row_once(app, client, manager_token):
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    from src.project.models import Project
+    
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(Session, "after_commit", listener)
+    try:
+        resp = client.post(
+            "/api/projects",
+            json={"name": "Audited", "description": "Desc"},
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+    finally:
+        event.remove(Session, "after_commit", listener)
+    
+    assert resp.status_code == 201
+    assert len(commits) == 1
+    project_id = resp.get_json()["id"]
+    assert Project.query.filter_by(id=project_id).count() == 1
+    assert Log.query.filter_by(action=ActionType.PROJECT_CREATED, resource_id=project_id).count() == 1
+
+
+def test_unit_of_work_discard_rolls_back_and_skips_side_effects(app, manager_user):
+    from src.unit_of_work import unit_of_work, after_commit
+    from src.project.models import Project
+    from src.project.repository import ProjectRepository
+    from src.log.service import LogService
+    
+    side_effects = []
+    with unit_of_work() as uow:
+        project = ProjectRepository.create(Project(name="Draft", description="Desc", owner_id=manager_user.id))
+        LogService.log_action(action=ActionType.PROJECT_CREATED, resource_type="project", resource_id=project.id)
+        after_commit(lambda: side_effects.append("invalidated"))
+        uow.discard = True
+    
+    assert Project.query.filter_by(name="Draft").count() == 0
+    assert Log.query.count() == 0
+    assert side_effects == []
@@ -73,3 +73,164 @@ def test_register_unauthorized(client):
         json={"name": "New User", "email": "new@x.com", "password": "pass123"},
     )
     assert resp.status_code == 401
+
+
+def test_login_rehashes_password_when_cost_changes(client, test_user, monkeypatch):
+    from passlib.hash import bcrypt
+    from src.user.passwords import password_hasher
+    
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    resp = client.post("/api/auth/login", json={"email": test_user.email, "password": "password123"})
+    
+    assert resp.status_code == 200
+    assert bcrypt.from_string(test_user.password_hash).rounds == 5
+    assert client.post("/api/auth/login", json={"email": test_user.email, "password": "password123"}).status_code == 200
+
+
+def test_login_returns_503_when_hashing_is_saturated(client, test_user, monkeypatch):
+    from src.user.passwords import password_hasher
+    
+    monkeypatch.setattr(password_hasher, "enabled", True)
+    monkeypatch.setattr(password_hasher, "workers", 0)
+    monkeypatch.setattr(password_hasher, "queue_size", 0)
+    monkeypatch.setattr(password_hasher, "rejected", 0)
+    
+    resp = client.post("/api/auth/login", json={"email": test_user.email, "password": "password123"})
+    
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    assert password_hasher.stats()["rejected"] == 1
+
+
+def test_hasher_stats_endpoint_is_admin_only(client, admin_token, member_token):
+    assert client.get("/api/auth/hasher/stats", headers={"Authorization": f"Bearer {member_token}"}).status_code == 403
+    
+    resp = client.get("/api/auth/hasher/stats", headers={"Authorization": f"Bearer {admin_token}"})
+    assert resp.status_code == 200
+    assert {"in_flight", "queued", "capacity", "rejected"} <= resp.get_json().keys()
+
+
+def test_password_hasher_process_pool_round_trip():
+    from src.user.passwords import PasswordHasher
+    
+    hasher = PasswordHasher()
+    hasher.enabled, hasher.workers, hasher.rounds = True, 1, 4
+    try:
+        password_hash = hasher.hash("secret")
+        assert hasher.verify("secret", password_hash)
+        assert not hasher.verify("wrong", password_hash)
+        assert hasher.depth == 0
+    finally:
+        hasher._executor.shutdown()
+
+
+def test_login_rate_limited_per_email(app, client, test_user):
+    app.config["RATE_LIMIT_LOGIN_PER_EMAIL"] = 2
+    
+    statuses = [
+        client.post("/api/auth/login", json={"email": test_user.email.upper(), "password": "wrong"}).status_code
+        for _ in range(3)
+    ]
+    resp = client.post("/api/auth/login", json={"email": test_user.email, "password": "password123"})
+    
+    assert statuses == [401, 401, 429]
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == str(app.config["RATE_LIMIT_WINDOW_SECONDS"])
+    assert client.post("/api/auth/login", json={"email": "other@example.com", "password": "x"}).status_code == 401
+
+
+def test_login_rate_limited_per_ip(app, client):
+    app.config["RATE_LIMIT_LOGIN_PER_IP"] = 1
+    
+    assert client.post("/api/auth/login", json={"email": "a@x.com", "password": "x"}).status_code == 401
+    assert client.post("/api/auth/login", json={"email": "b@x.com", "password": "x"}).status_code == 429
+    assert client.post(
+        "/api/auth/login", json={"email": "b@x.com", "password": "x"}, environ_base={"REMOTE_ADDR": "10.0.0.2"}
+    ).status_code == 401
+
+
+def test_login_rate_limit_uses_forwarded_ip_behind_trusted_proxy(app):
+    from src.factory import create_app
+    from tests.conftest import TestConfig
+    
+    class ProxiedConfig(TestConfig):
+        TRUSTED_PROXY_COUNT = 1
+        RATE_LIMIT_LOGIN_PER_IP = 1
+    
+    proxied = create_app(ProxiedConfig()).test_client()
+    balancer = {"REMOTE_ADDR": "10.0.0.1"}
+    login = {"email": "a@x.com", "password": "x"}
+    assert proxied.post("/api/auth/login", json=login, environ_base=balancer, headers={"X-Forwarded-For": "1.1.1.1"}).status_code == 401
+    assert proxied.post("/api/auth/login", json=login, environ_base=balancer, headers={"X-Forwarded-For": "2.2.2.2"}).status_code == 401
+    assert proxied.post("/api/auth/login", json=login, environ_base=balancer, headers={"X-Forwarded-For": "2.2.2.2"}).status_code == 429
+
+
+def test_unknown_email_is_negatively_cached_until_registered(app, client, admin_token):
+    from src import request_scope
+    from src.user.service import UserService
+    
+    with app.test_request_context():
+        request_scope.reset()
+        assert UserService.authenticate("new@x.com", "secret1") is None
+        queries_after_miss = request_scope.query_count()
+        assert UserService.authenticate("new@x.com", "secret1") is None
+        assert request_scope.query_count() == queries_after_miss == 1
+    
+    client.post(
+        "/api/auth/register",
+        json={"name": "New", "email": "new@x.com", "password": "secret1"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert client.post("/api/auth/login", json={"email": "new@x.com", "password": "secret1"}).status_code == 200
+
+
+def test_deleted_user_tokens_are_revoked(client, member_user, admin_token):
+    tokens = client.post("/api/auth/login", json={"email": member_user.email, "password": "pass"}).get_json()
+    access = {"Authorization": f"Bearer {tokens['access_token']}"}
+    refresh = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    assert client.get("/api/projects", headers=access).status_code == 200
+    
+    client.delete(f"/api/users/{member_user.id}", headers={"Authorization": f"Bearer {admin_token}"})
+    
+    assert client.get("/api/projects", headers=access).status_code == 401
+    assert client.post("/api/auth/refresh", headers=refresh).status_code == 401
+
+
+def test_deleted_user_cannot_connect_socket(app, client, member_user, admin_token):
+    from src.extensions import socketio
+    
+    token = client.post("/api/auth/login", json={"email": member_user.email, "password": "pass"}).get_json()["access_token"]
+    socket = socketio.test_client(app, flask_test_client=client, auth={"token": token})
+    assert socket.is_connected()
+    socket.disconnect()
+    
+    client.delete(f"/api/users/{member_user.id}", headers={"Authorization": f"Bearer {admin_token}"})
+    
+    assert not socketio.test_client(app, flask_test_client=client, auth={"token": token}).is_connected()
+
+
+def test_unrevoked_token_skips_blocklist_lookup(client, test_user, monkeypatch):
+    from src.cache import cache
+    from src.auth.blocklist import REVOKED_TOKENS_KEY, token_blocklist
+    
+    token_blocklist.revoke({"other-jti": 4102444800})
+    lookups = []
+    is_live_member = cache.is_live_member
+    monkeypatch.setattr(cache, "is_live_member", lambda *args: lookups.append(args) or is_live_member(*args))
+    
+    tokens = client.post("/api/auth/login", json={"email": test_user.email, "password": "password123"}).get_json()
+    assert client.get("/api/projects", headers={"Authorization": f"Bearer {tokens['access_token']}"}).status_code == 200
+    assert lookups == []
+    assert token_blocklist.is_revoked("other-jti")
+    assert lookups == [(REVOKED_TOKENS_KEY, "other-jti")]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    from src.auth.blocklist import BloomFilter
+    
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
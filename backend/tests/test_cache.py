@@ -0,0 +1,291 @@
+import time
+import pytest
+from src.cache.serializers import get_serializer
+from src.user.dto import UserDTO
+from src.user.models import UserRole
+from src.task.dto import TaskDTO
+from src.task.models import TaskStatus
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_serializer_round_trips_dto_payloads(name):
+    serializer = get_serializer(name)
+    user = UserDTO(id="u1", name="User", email="u@x.com", role=UserRole.MANAGER)
+    task = TaskDTO(id="t1", title="T", description="D", status=TaskStatus.DONE, project_id="p1", assignee_id=None)
+    
+    data = serializer.dumps({"user": user.to_dict(), "tasks": [task.to_dict()]})
+    assert isinstance(data, bytes)
+    
+    loaded = serializer.loads(data)
+    assert UserDTO.from_dict(loaded["user"]) == user
+    assert [TaskDTO.from_dict(t) for t in loaded["tasks"]] == [task]
+
+
+def test_get_serializer_unknown_name():
+    with pytest.raises(ValueError):
+        get_serializer("pickle")
+
+
+def test_dto_is_read_only():
+    user = UserDTO(id="u1", name="User", email="u@x.com", role=UserRole.MEMBER)
+    with pytest.raises(AttributeError):
+        user.name = "Other"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.gets = 0
+        self.round_trips = 0
+    
+    def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+    
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+    
+    def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+    
+    def expire(self, key, seconds):
+        return key in self.store
+    
+    def delete(self, key):
+        return 1 if self.store.pop(key, None) is not None else 0
+    
+    def unlink(self, *keys):
+        return sum(self.delete(key) for key in keys)
+    
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append(getattr(self.client, name)(*args, **kwargs))
+    
+    def execute(self):
+        self.client.round_trips += 1
+        return self.calls
+
+
+@pytest.fixture()
+def two_tier_cache():
+    import os
+    from src.cache.client import Cache
+    from src.cache.local import LocalCache
+    
+    cache = Cache()
+    cache.client = FakeRedis()
+    cache.local = LocalCache(max_size=8, ttl=60)
+    cache._listener_pid = os.getpid()
+    return cache
+
+
+def test_local_cache_evicts_least_recently_used():
+    from src.cache.local import LocalCache, MISSING
+    
+    local = LocalCache(max_size=2, ttl=60)
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+    
+    assert local.get("b") is MISSING
+    assert local.get("a") == 1
+    assert local.get("c") == 3
+
+
+def test_local_cache_expires_entries():
+    from src.cache.local import LocalCache, MISSING
+    
+    local = LocalCache(max_size=2, ttl=0)
+    local.set("a", 1)
+    assert local.get("a") is MISSING
+
+
+def test_two_tier_cache_serves_repeat_reads_from_l1(two_tier_cache):
+    two_tier_cache.client.store["user:1"] = "payload"
+    
+    assert two_tier_cache.get("user:1") == "payload"
+    assert two_tier_cache.get("user:1") == "payload"
+    
+    assert two_tier_cache.client.gets == 1
+    stats = two_tier_cache.stats()
+    assert stats["l1_hits"] == 1
+    assert stats["l2_hits"] == 1
+
+
+def test_two_tier_cache_delete_broadcasts_invalidation(two_tier_cache):
+    from src.cache.client import INVALIDATION_CHANNEL
+    
+    two_tier_cache.set("user:1", "payload", ex=60)
+    two_tier_cache.delete("user:1")
+    
+    assert two_tier_cache.get("user:1") is None
+    assert two_tier_cache.client.published == [(INVALIDATION_CHANNEL, "user:1")]
+
+
+def test_delete_many_invalidates_in_one_round_trip(two_tier_cache):
+    keys = [f"projects:{i}" for i in range(200)]
+    two_tier_cache.client.store.update({key: "[]" for key in keys})
+    
+    assert two_tier_cache.delete_many(keys) == 200
+    assert two_tier_cache.client.round_trips == 1
+    assert [two_tier_cache.get(key) for key in keys[:3]] == [None, None, None]
+    assert len(two_tier_cache.client.published) == 200
+
+
+def test_version_changes_when_key_is_deleted(two_tier_cache):
+    first = two_tier_cache.version("tasks:p1")
+    
+    assert two_tier_cache.version("tasks:p1") == first
+    two_tier_cache.delete("tasks:p1")
+    second = two_tier_cache.version("tasks:p1")
+    two_tier_cache.delete_many(["tasks:p1", "users:all"])
+    
+    assert len({first, second, two_tier_cache.version("tasks:p1")}) == 3
+
+
+def test_version_does_not_restart_after_generation_is_lost(two_tier_cache):
+    two_tier_cache.delete("tasks:p1")
+    two_tier_cache.client.store.clear()
+    two_tier_cache.delete("tasks:p1")
+    
+    generation = int(two_tier_cache.version("tasks:p1").rsplit(":", 1)[1])
+    assert generation > 1_000_000
+
+
+
+def test_schema_version_does_not_namespace_security_state(two_tier_cache):
+    two_tier_cache.key_prefix = "v2:"
+    two_tier_cache.set("user:1", "payload")
+    two_tier_cache.set("auth:tokens:u1", "payload")
+    two_tier_cache.set("ratelimit:login:ip", "payload")
+    
+    assert set(two_tier_cache.client.store) == {"v2:user:1", "auth:tokens:u1", "ratelimit:login:ip"}
+
+
+def test_cache_stats_endpoint_is_admin_only(client, admin_token, member_token):
+    assert client.get("/api/cache/stats", headers={"Authorization": f"Bearer {member_token}"}).status_code == 403
+    
+    resp = client.get("/api/cache/stats", headers={"Authorization": f"Bearer {admin_token}"})
+    assert resp.status_code == 200
+    assert {"l2_hits", "l2_misses"} <= resp.get_json().keys()
+
+
+@pytest.fixture()
+def redis_cache():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from src.cache.client import Cache
+    
+    server = fakeredis.FakeServer()
+    cache = Cache()
+    cache.client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    cache.raw_client = fakeredis.FakeRedis(server=server)
+    cache.key_prefix = "v1:"
+    return cache
+
+
+def test_read_through_lock_lets_one_caller_load(redis_cache):
+    import threading
+    
+    loads = []
+    release = threading.Event()
+    
+    def loader():
+        loads.append(threading.current_thread().name)
+        release.wait(2)
+        return "payload"
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(redis_cache.get_or_set("users:all", loader, ex=60)), name=f"reader-{i}")
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    assert redis_cache.client.exists("v1:lock:users:all")
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert len(loads) == 1
+    assert results == ["payload"] * 4
+    assert not redis_cache.client.exists("v1:lock:users:all")
+
+
+def test_read_through_falls_back_to_loader_when_lock_holder_never_writes(redis_cache):
+    redis_cache.client.set("v1:lock:users:all", "someone-else", px=5000)
+    
+    started = time.monotonic()
+    assert redis_cache.get_or_set("users:all", lambda: "payload", wait_timeout=0.2) == "payload"
+    
+    assert 0.2 <= time.monotonic() - started < 1
+    # The lock belongs to another caller and must survive this one.
+    assert redis_cache.client.get("v1:lock:users:all") == "someone-else"
+
+
+def test_set_set_only_stores_under_the_version_it_was_loaded_at(redis_cache):
+    version = redis_cache.version("project:p1:members")
+    assert redis_cache.get_set("project:p1:members") is None
+    
+    assert redis_cache.set_set("project:p1:members", set(), version, ex=60) == 1
+    assert redis_cache.get_set("project:p1:members") == set()
+    assert redis_cache.set_contains("project:p1:members", "u1") is False
+    assert 0 < redis_cache.client.ttl("v1:project:p1:members") <= 60
+    
+    stale = redis_cache.version("project:p1:members")
+    redis_cache.delete("project:p1:members")
+    assert redis_cache.set_set("project:p1:members", {"u1"}, stale, ex=60) == 0
+    assert redis_cache.set_contains("project:p1:members", "u1") is None
+    
+    current = redis_cache.version("project:p1:members")
+    assert redis_cache.set_set("project:p1:members", {"u1", "u2"}, current) == 1
+    assert redis_cache.get_set("project:p1:members") == {"u1", "u2"}
+
+
+def test_add_expiring_drops_expired_members_and_only_extends_the_key(redis_cache):
+    now = time.time()
+    redis_cache.add_expiring("auth:revoked", {"old": now - 1, "jti-1": now + 100})
+    
+    assert redis_cache.live_members("auth:revoked") == {"jti-1": pytest.approx(now + 100)}
+    assert redis_cache.client.zscore("auth:revoked", "old") is None
+    assert redis_cache.is_live_member("auth:revoked", "jti-1") is True
+    assert redis_cache.is_live_member("auth:revoked", "old") is False
+    assert 90 < redis_cache.client.ttl("auth:revoked") <= 101
+    
+    redis_cache.add_expiring("auth:revoked", {"jti-2": now + 10})
+    assert 90 < redis_cache.client.ttl("auth:revoked") <= 101
+    redis_cache.add_expiring("auth:revoked", {"jti-3": now + 1000})
+    assert 990 < redis_cache.client.ttl("auth:revoked") <= 1001
+
+
+def test_revoked_token_expires_from_the_blocklist(redis_cache, monkeypatch):
+    from src.auth import blocklist
+    
+    monkeypatch.setattr(blocklist, "cache", redis_cache)
+    tokens = blocklist.TokenBlocklist()
+    now = time.time()
+    tokens.revoke({"live": now + 60, "short": now + 0.2})
+    
+    assert tokens.is_revoked("live") and tokens.is_revoked("short")
+    assert not tokens.is_revoked("never-revoked")
+    time.sleep(0.3)
+    assert tokens.is_revoked("live")
+    assert not tokens.is_revoked("short")
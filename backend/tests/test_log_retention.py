@@ -0,0 +1,39 @@
+from datetime import date, datetime
+from src.extensions import db
+from src.log.models import Log, LogDailyCount, ActionType
+from src.log.partitions import LogPartitions, month_start, partition_name
+from src.log.repository import LogRepository
+
+
+def add_log(action: ActionType, created_at: datetime) -> None:
+    db.session.add(Log(action=action, created_at=created_at))
+    db.session.commit()
+
+
+def test_month_helpers():
+    assert month_start(date(2024, 11, 15), 2) == date(2025, 1, 1)
+    assert month_start(date(2024, 1, 31), -1) == date(2023, 12, 1)
+    assert partition_name(date(2025, 3, 1)) == "logs_y2025m03"
+
+
+def test_rollup_daily_counts_is_idempotent(app):
+    add_log(ActionType.LOGIN, datetime(2025, 3, 10, 8))
+    add_log(ActionType.LOGIN, datetime(2025, 3, 10, 23, 59))
+    add_log(ActionType.TASK_CREATED, datetime(2025, 3, 10, 12))
+    add_log(ActionType.LOGIN, datetime(2025, 3, 11, 0, 0))
+    
+    LogRepository.rollup_daily_counts(date(2025, 3, 10))
+    LogRepository.rollup_daily_counts(date(2025, 3, 10))
+    
+    counts = {row.action: row.count for row in LogDailyCount.query.filter_by(day=date(2025, 3, 10))}
+    assert counts == {ActionType.LOGIN: 2, ActionType.TASK_CREATED: 1}
+
+
+def test_drop_expired_falls_back_to_row_deletes(app):
+    add_log(ActionType.LOGIN, datetime(2024, 1, 31))
+    add_log(ActionType.LOGIN, datetime(2024, 2, 1))
+    
+    assert not LogPartitions.is_partitioned()
+    LogPartitions.drop_expired(retention_months=12, today=date(2025, 2, 20))
+    
+    assert [log.created_at for log in Log.query.all()] == [datetime(2024, 2, 1)]
@@ -0,0 +1,88 @@
+import json
+import logging
+from src.log.service import LogService
+from src.log.structured import JsonFormatter, TextFormatter, RequestContextFilter
+
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "Task created", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_emits_one_object_per_record():
+    record = make_record(context={"task_id": "t1"}, request_id="r1", status=201, latency_ms=1.5)
+    
+    payload = json.loads(JsonFormatter().format(record))
+    
+    assert payload["level"] == "INFO"
+    assert payload["message"] == "Task created"
+    assert payload["context"] == {"task_id": "t1"}
+    assert payload["request_id"] == "r1"
+    assert payload["latency_ms"] == 1.5
+    assert "user_id" not in payload
+
+
+def test_text_formatter_keeps_error_and_context_suffixes():
+    line = TextFormatter().format(make_record(error=ValueError("boom"), context={"a": 1}))
+    assert line.endswith("Task created | Error: boom | Context: {'a': 1}")
+
+
+def test_disabled_level_never_builds_a_record(app):
+    logger = logging.getLogger("app")
+    handler = Capture()
+    logger.addHandler(handler)
+    try:
+        LogService.log_debug("Not shown", context={"a": 1})
+        LogService.log_info("Shown")
+    finally:
+        logger.removeHandler(handler)
+    
+    assert [r.getMessage() for r in handler.records] == ["Shown"]
+
+
+def test_request_filter_and_header_carry_request_id(app, client, member_token):
+    app.config["REQUEST_LOG_SLOW_MS"] = 0
+    handler = Capture()
+    handler.addFilter(RequestContextFilter())
+    logger = logging.getLogger("app")
+    logger.addHandler(handler)
+    try:
+        resp = client.get("/api/projects", headers={"Authorization": f"Bearer {member_token}", "X-Request-ID": "req-42"})
+    finally:
+        logger.removeHandler(handler)
+    
+    assert resp.headers["X-Request-ID"] == "req-42"
+    finished = [r for r in handler.records if r.getMessage() == "Request finished"][-1]
+    assert finished.request_id == "req-42"
+    assert finished.route == "/api/projects"
+    assert finished.status == 200
+    assert finished.user_id
+
+
+def test_request_finished_is_debug_unless_slow_or_query_heavy(app, client, member_token):
+    handler = Capture()
+    logger = logging.getLogger("app")
+    logger.addHandler(handler)
+    headers = {"Authorization": f"Bearer {member_token}"}
+    try:
+        # Keyset pages are read from the database on every request.
+        client.get("/api/projects?limit=5", headers=headers)
+        app.config["REQUEST_LOG_MAX_QUERIES"] = 0
+        client.get("/api/projects?limit=5", headers=headers)
+    finally:
+        logger.removeHandler(handler)
+    
+    finished = [r for r in handler.records if r.getMessage() == "Request finished"]
+    assert len(finished) == 1
+    assert finished[0].levelno == logging.INFO
+    assert finished[0].queries > 0
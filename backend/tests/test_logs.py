@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+from src.extensions import db
+from src.log.models import Log, ActionType
+
+
+def add_logs(count: int, **fields) -> None:
+    for i in range(count):
+        db.session.add(Log(created_at=datetime(2025, 1, 1, 12, i // 2), **fields))
+    db.session.commit()
+
+
+def test_list_logs_forbidden_as_member(client, member_token):
+    resp = client.get("/api/logs", headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 403
+
+
+def test_list_logs_keyset_pages_cover_every_row_once(client, admin_token):
+    add_logs(7, action=ActionType.TASK_CREATED, resource_type="task")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    
+    seen, cursor = [], None
+    while True:
+        params = {"action": "task_created", "limit": 3, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/logs", query_string=params, headers=headers).get_json()
+        seen.extend(item["id"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    
+    expected = [log.id for log in Log.query.filter_by(action=ActionType.TASK_CREATED).order_by(Log.created_at.desc(), Log.id.desc())]
+    assert seen == expected
+
+
+def test_list_logs_filters_by_user_and_time_range(client, admin_token):
+    add_logs(4, action=ActionType.LOGIN, user_id="u1")
+    add_logs(2, action=ActionType.LOGIN, user_id="u2")
+    
+    resp = client.get(
+        "/api/logs",
+        query_string={"user_id": "u1", "since": "2025-01-01T12:01:00", "until": "2025-01-01T12:02:00"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    
+    items = resp.get_json()["items"]
+    assert len(items) == 2
+    assert {item["user_id"] for item in items} == {"u1"}
+
+
+def test_list_logs_converts_time_range_offsets_to_utc(client, admin_token):
+    add_logs(4, action=ActionType.LOGIN, user_id="u1")
+    
+    resp = client.get(
+        "/api/logs",
+        query_string={"since": "2025-01-01T14:01:00+02:00", "until": "2025-01-01T07:02:00-05:00"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    
+    assert len(resp.get_json()["items"]) == 2
+
+
+def test_list_logs_rejects_invalid_filters(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/api/logs?action=nope", headers=headers).status_code == 422
+    assert client.get("/api/logs?cursor=!!", headers=headers).status_code == 422
+
+
+def test_export_logs_streams_ndjson(client, admin_token):
+    add_logs(3, action=ActionType.PROJECT_CREATED, resource_type="project", resource_id="p1")
+    
+    resp = client.get("/api/logs/export?resource_type=project&resource_id=p1", headers={"Authorization": f"Bearer {admin_token}"})
+    
+    assert resp.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+    assert len(rows) == 3
+    assert {row["resource_id"] for row in rows} == {"p1"}
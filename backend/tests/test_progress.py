@@ -0,0 +1,88 @@
+import os
+from unittest.mock import patch
+from src.task.broadcaster import ProgressBroadcaster
+
+
+def test_progress_broadcaster_coalesces_per_project():
+    broadcaster = ProgressBroadcaster()
+    broadcaster._worker_pid = os.getpid()
+    
+    members = {"p1": {"u2", "u1"}, "p2": {"u3"}}
+    with patch("src.task.broadcaster.socketio.emit") as emit, \
+            patch("src.task.broadcaster.ProjectMembership.member_ids", side_effect=members.get):
+        broadcaster.publish("p1", 10)
+        broadcaster.publish("p1", 20)
+        broadcaster.publish("p2", 50)
+        broadcaster.publish("p1", 30)
+        assert emit.call_count == 0
+        
+        broadcaster.flush()
+    
+    assert [c.args for c in emit.call_args_list] == [
+        ("project_progress", {"project_id": "p1", "percent": 30}),
+        ("project_progress", {"project_id": "p2", "percent": 50}),
+    ]
+    assert [c.kwargs["to"] for c in emit.call_args_list] == [["user:u1", "user:u2"], ["user:u3"]]
+
+
+def test_progress_broadcaster_without_window_emits_immediately():
+    broadcaster = ProgressBroadcaster()
+    broadcaster.window = 0
+    
+    with patch("src.task.broadcaster.socketio.emit") as emit, \
+            patch("src.task.broadcaster.ProjectMembership.member_ids", side_effect={"p1": {"u1"}}.get):
+        broadcaster.publish("p1", 10)
+        broadcaster.publish("missing", 10)
+    
+    emit.assert_called_once_with("project_progress", {"project_id": "p1", "percent": 10}, to=["user:u1"])
+
+
+def test_socket_clients_only_receive_progress_for_their_projects(app, client, manager_user, member_user, manager_token, member_token, monkeypatch):
+    from src.extensions import socketio
+    from src.task.broadcaster import progress_broadcaster
+    from src.project.service import ProjectService
+    
+    monkeypatch.setattr(progress_broadcaster, "window", 0)
+    project = ProjectService.create_project(manager_user.id, {"name": "P", "description": "D"})
+    
+    manager_socket = socketio.test_client(app, flask_test_client=client, auth={"token": manager_token})
+    member_socket = socketio.test_client(app, flask_test_client=client, auth={"token": member_token})
+    assert manager_socket.is_connected()
+    assert member_socket.is_connected()
+    
+    progress_broadcaster.publish(project.id, 40)
+    
+    assert [e["args"][0] for e in manager_socket.get_received()] == [{"project_id": project.id, "percent": 40}]
+    assert member_socket.get_received() == []
+    
+    assert member_socket.emit("join_project", {"project_id": project.id}, callback=True) == {"joined": False}
+
+
+def test_removed_member_stops_receiving_progress_without_reconnecting(app, client, manager_user, member_user, member_token, monkeypatch):
+    from src.extensions import socketio
+    from src.task.broadcaster import progress_broadcaster
+    from src.project.service import ProjectService
+    
+    monkeypatch.setattr(progress_broadcaster, "window", 0)
+    project = ProjectService.create_project(manager_user.id, {"name": "P", "description": "D"})
+    member_socket = socketio.test_client(app, flask_test_client=client, auth={"token": member_token})
+    
+    ProjectService.add_member(project.id, manager_user.id, member_user.id)
+    progress_broadcaster.publish(project.id, 10)
+    assert [e["args"][0]["percent"] for e in member_socket.get_received()] == [10]
+    assert member_socket.emit("join_project", {"project_id": project.id}, callback=True) == {"joined": True}
+    
+    ProjectService.remove_member(project.id, manager_user.id, member_user.id)
+    progress_broadcaster.publish(project.id, 20)
+    assert member_socket.get_received() == []
+    
+    ProjectService.add_member(project.id, manager_user.id, member_user.id)
+    ProjectService.delete_project(project.id, manager_user.id)
+    progress_broadcaster.publish(project.id, 30)
+    assert member_socket.get_received() == []
+
+
+def test_socket_connection_requires_token(app, client):
+    from src.extensions import socketio
+    
+    assert not socketio.test_client(app, flask_test_client=client).is_connected()
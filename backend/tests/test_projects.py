@@ -50,6 +50,89 @@ def test_list_projects_for_user(client, manager_user, member_user, auth_token, a
     assert len(data) == 1
 
 
+def test_list_projects_paged_counts_each_project_once(client, manager_user, member_user, admin_user, manager_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    for i in range(3):
+        project_id = client.post("/api/projects", json={"name": f"Project {i}", "description": "D"}, headers=headers).get_json()["id"]
+        for user in (member_user, admin_user):
+            client.post(f"/api/projects/{project_id}/members", json={"user_id": user.id}, headers=headers)
+    
+    first = client.get("/api/projects?limit=2&fields=name", headers=headers).get_json()
+    second = client.get(f"/api/projects?limit=2&fields=name&cursor={first['next_cursor']}", headers=headers).get_json()
+    
+    assert first["items"] == [{"name": "Project 0"}, {"name": "Project 1"}]
+    assert second == {"items": [{"name": "Project 2"}], "next_cursor": None}
+    
+    resp = client.get("/api/projects?status=completed", headers=headers)
+    assert resp.get_json() == []
+
+
+def test_list_projects_conditional_get(client, manager_user, manager_token, monkeypatch):
+    from src.project.service import ProjectService
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    
+    first = client.get("/api/projects", headers=headers)
+    etag = first.headers["ETag"]
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("listing rebuilt although the ETag matched")
+    
+    with monkeypatch.context() as patched:
+        patched.setattr(ProjectService, "list_projects_for_user", fail)
+        resp = client.get("/api/projects", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    
+    assert client.get("/api/projects?fields=id", headers={**headers, "If-None-Match": etag}).status_code == 200
+    
+    client.patch(f"/api/projects/{project_id}", json={"name": "Renamed"}, headers=headers)
+    resp = client.get("/api/projects", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    assert resp.get_json()[0]["name"] == "Renamed"
+
+
+def test_conditional_get_etag_describes_the_body_served(client, manager_user, manager_token):
+    import hashlib
+    from src.cache import cache
+    from src.project.dto import ProjectDTO
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    original = client.get("/api/projects", headers=headers)
+    stale = [ProjectDTO.from_dict(p) for p in original.get_json()]
+    
+    client.patch(f"/api/projects/{project_id}", json={"name": "Renamed"}, headers=headers)
+    # A reader that loaded before the rename stores its old listing after the invalidation.
+    cache.set_models(f"projects:{manager_user.id}", stale)
+    
+    resp = client.get("/api/projects", headers=headers)
+    assert resp.get_json()[0]["name"] == "Project 1"
+    assert resp.headers["ETag"] == original.headers["ETag"] == f'"{hashlib.sha1(resp.get_data()).hexdigest()}"'
+    
+    # Once the stale entry is gone the fresh body gets a different ETag instead of a 304.
+    cache.delete(f"projects:{manager_user.id}")
+    resp = client.get("/api/projects", headers={**headers, "If-None-Match": original.headers["ETag"]})
+    assert resp.status_code == 200
+    assert resp.get_json()[0]["name"] == "Renamed"
+
+
+def test_get_project_etag_is_accepted_as_if_match(client, manager_user, manager_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    etag = client.get(f"/api/projects/{project_id}", headers=headers).headers["ETag"]
+    
+    resp = client.patch(f"/api/projects/{project_id}", json={"name": "Renamed"}, headers={**headers, "If-Match": etag})
+    assert resp.status_code == 200
+    
+    resp = client.patch(f"/api/projects/{project_id}", json={"name": "Again"}, headers={**headers, "If-Match": etag})
+    assert resp.status_code == 412
+    
+    resp = client.get(f"/api/projects/{project_id}", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] == f'"{resp.get_json()["version"]}"'
+
+
 def test_get_project_success(client, manager_user, manager_token):
     resp = client.post(
         "/api/projects",
@@ -156,6 +239,28 @@ def test_delete_project_success(client, manager_user, manager_token):
     assert resp.status_code == 404
 
 
+def test_delete_project_drops_membership_sets_in_one_call(client, manager_user, manager_token, monkeypatch):
+    from src.cache import cache
+    from src.project.membership import members_key, user_projects_key
+    from src.project.service import ProjectService
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    members = [UserRepository.create(f"Member {i}", f"m{i}@x.com", "pass") for i in range(3)]
+    for member in members:
+        client.post(f"/api/projects/{project_id}/members", json={"user_id": member.id}, headers=headers)
+    for user_id in (manager_user.id, *(m.id for m in members)):
+        assert project_id in ProjectService.project_ids_for_user(user_id)
+    
+    calls = []
+    monkeypatch.setattr(cache, "delete_many", lambda keys: calls.append(("delete_many", set(keys))))
+    assert client.delete(f"/api/projects/{project_id}", headers=headers).status_code == 204
+    
+    membership_calls = [call for call in calls if members_key(project_id) in call[1]]
+    assert membership_calls == [
+        ("delete_many", {members_key(project_id), *(user_projects_key(u) for u in (manager_user.id, *(m.id for m in members)))}),
+    ]
+
+
 def test_add_member_success(client, manager_user, member_user, manager_token):
     resp = client.post(
         "/api/projects",
@@ -227,3 +332,26 @@ def test_remove_member_success(client, manager_user, member_user, manager_token)
         headers={"Authorization": f"Bearer {manager_token}"},
     )
     assert resp.status_code == 204
+
+
+def test_get_project_requires_membership(client, manager_user, member_user, admin_user, manager_token, member_token, admin_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "Description 1"}, headers=headers).get_json()["id"]
+    
+    assert client.get(f"/api/projects/{project_id}", headers={"Authorization": f"Bearer {member_token}"}).status_code == 403
+    assert client.get(f"/api/projects/{project_id}", headers={"Authorization": f"Bearer {admin_token}"}).status_code == 200
+    assert client.get("/api/projects/missing", headers={"Authorization": f"Bearer {member_token}"}).status_code == 404
+
+
+def test_stale_version_in_any_route_returns_412(client, manager_user, member_user, manager_token, monkeypatch):
+    from src.project.service import ProjectService
+    from src.versioning import StaleVersionError
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    
+    def concurrent_flush(*args, **kwargs):
+        raise StaleVersionError("project was changed concurrently")
+    
+    monkeypatch.setattr(ProjectService, "add_member", concurrent_flush)
+    resp = client.post(f"/api/projects/{project_id}/members", json={"user_id": member_user.id}, headers=headers)
+    assert resp.status_code == 412
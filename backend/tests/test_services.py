@@ -175,3 +175,231 @@ def test_task_service_update_status_not_assignee(app, manager_user, member_user,
         
         with pytest.raises(PermissionError):
             TaskService.update_status(task.id, member2.id, TaskStatus.DONE.value)
+
+
+def test_project_service_list_projects_for_user_is_cached(app, manager_user, project_data):
+    with app.app_context():
+        from unittest.mock import patch
+        from src.project.repository import ProjectRepository
+        
+        ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.list_projects_for_user(manager_user.id)
+        
+        with patch.object(ProjectRepository, "list_for_user", side_effect=AssertionError("cache miss")):
+            projects = ProjectService.list_projects_for_user(manager_user.id)
+        assert len(projects) == 1
+        assert projects[0].to_dict()["owner_id"] == manager_user.id
+
+
+def test_project_service_membership_change_invalidates_listings(app, manager_user, member_user, project_data):
+    with app.app_context():
+        member2 = UserRepository.create("Member2", "member2@example.com", "pass", role=UserRole.MEMBER.value)
+        project = ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        
+        assert ProjectService.list_projects_for_user(member_user.id)[0].members == (member_user.id,)
+        
+        ProjectService.add_member(project.id, manager_user.id, member2.id)
+        assert set(ProjectService.list_projects_for_user(member_user.id)[0].members) == {member_user.id, member2.id}
+        
+        ProjectService.remove_member(project.id, manager_user.id, member_user.id)
+        assert ProjectService.list_projects_for_user(member_user.id) == []
+
+
+def test_user_service_delete_user_invalidates_project_listings(app, manager_user, member_user, project_data):
+    with app.app_context():
+        project = ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        assert ProjectService.list_projects_for_user(member_user.id)[0].owner_id == manager_user.id
+        
+        UserService.delete_user(manager_user.id)
+        
+        assert ProjectService.list_projects_for_user(member_user.id)[0].owner_id is None
+        assert ProjectService.list_projects_for_user(manager_user.id) == []
+
+
+def test_project_membership_index_follows_membership_changes(app, manager_user, member_user, project_data):
+    from src import request_scope
+    
+    with app.test_request_context():
+        project = ProjectService.create_project(manager_user.id, project_data)
+        assert ProjectService.is_member(project.id, manager_user.id)
+        assert not ProjectService.is_member(project.id, member_user.id)
+        assert ProjectService.is_member("missing", member_user.id) is None
+        assert ProjectService.project_ids_for_user(member_user.id) == set()
+        
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        assert ProjectService.is_member(project.id, member_user.id)
+        assert ProjectService.project_ids_for_user(member_user.id) == {project.id}
+        request_scope.reset()
+        assert ProjectService.is_member(project.id, member_user.id)
+        assert ProjectService.project_ids_for_user(member_user.id) == {project.id}
+        assert request_scope.query_count() == 0
+        
+        ProjectService.remove_member(project.id, manager_user.id, member_user.id)
+        assert not ProjectService.is_member(project.id, member_user.id)
+        assert ProjectService.project_ids_for_user(member_user.id) == set()
+        
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        UserService.delete_user(member_user.id)
+        assert not ProjectService.is_member(project.id, member_user.id)
+        assert ProjectService.project_ids_for_user(member_user.id) == set()
+        
+        ProjectService.delete_project(project.id, manager_user.id)
+        assert ProjectService.is_member(project.id, manager_user.id) is None
+        assert ProjectService.project_ids_for_user(manager_user.id) == set()
+
+
+def test_membership_rebuild_does_not_resurrect_a_removed_member(app, manager_user, member_user, project_data, monkeypatch):
+    from src.cache import cache
+    from src.project.membership import members_key
+    from src.project.repository import ProjectRepository
+    
+    with app.test_request_context():
+        project = ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        stale = {manager_user.id, member_user.id}
+        
+        def read_then_lose_race(project_id):
+            # The removal commits, and its after-commit hook runs, after this rebuild read the database.
+            ProjectService.remove_member(project.id, manager_user.id, member_user.id)
+            return stale
+        
+        with monkeypatch.context() as patched:
+            patched.setattr(ProjectRepository, "member_ids", read_then_lose_race)
+            assert ProjectService.is_member(project.id, member_user.id)
+        
+        assert cache.get_set(members_key(project.id)) is None
+        assert not ProjectService.is_member(project.id, member_user.id)
+
+
+def test_repository_get_by_id_is_memoized_per_request(app, manager_user, project_data):
+    from src import request_scope
+    from src.project.repository import ProjectRepository
+    
+    with app.test_request_context():
+        project_id = ProjectService.create_project(manager_user.id, project_data).id
+        request_scope.reset()
+        
+        first = ProjectRepository.get_by_id(project_id)
+        queries_after_first = request_scope.query_count()
+        second = ProjectRepository.get_by_id(project_id)
+        
+        assert second is first
+        assert request_scope.query_count() == queries_after_first == 1
+
+
+@pytest.mark.parametrize("project_count", [1, 5])
+def test_list_for_user_serializes_with_constant_queries(app, manager_user, member_user, admin_user, project_data, project_count):
+    from src import request_scope
+    from src.extensions import db
+    from src.project.repository import ProjectRepository
+    
+    for _ in range(project_count):
+        project = ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        ProjectService.add_member(project.id, manager_user.id, admin_user.id)
+    member_ids = sorted([member_user.id, admin_user.id])
+    db.session.expire_all()
+    
+    with app.test_request_context():
+        request_scope.reset()
+        projects = [p.to_dict() for p in ProjectRepository.list_for_user(member_ids[0])]
+        
+        assert len(projects) == project_count
+        assert all(sorted(p["members"]) == member_ids for p in projects)
+        assert request_scope.query_count() == 2
+
+
+def test_repository_get_by_id_skips_soft_deleted_memo(app, manager_user, project_data):
+    from src import request_scope
+    from src.project.repository import ProjectRepository
+    
+    with app.test_request_context():
+        project = ProjectService.create_project(manager_user.id, project_data)
+        request_scope.reset()
+        
+        ProjectRepository.delete(ProjectRepository.get_by_id(project.id))
+        
+        assert ProjectRepository.get_by_id(project.id) is None
+
+
+def test_project_task_stats_follow_task_mutations(app, manager_user, member_user, project_data):
+    with app.app_context():
+        from src.task.repository import TaskRepository
+        from src.task.models import Task
+        from src.task.stats import ProjectTaskStatsRepository
+        
+        project = ProjectService.create_project(manager_user.id, project_data)
+        ProjectService.add_member(project.id, manager_user.id, member_user.id)
+        assert ProjectTaskStatsRepository.get(project.id).total == 0
+        
+        task = TaskService.create_task(manager_user.id, {
+            "title": "Task", "description": "Desc", "project_id": project.id, "assignee_id": member_user.id,
+        })
+        TaskRepository.create(Task(title="Other", description="Desc", project_id=project.id, assignee_id=member_user.id))
+        TaskService.update_status(task.id, member_user.id, TaskStatus.DONE.value)
+        
+        stats = ProjectTaskStatsRepository.get(project.id)
+        assert stats.total == 2
+        assert stats.count(TaskStatus.DONE) == 1
+        assert stats.percent_done == 50
+        
+        UserService.delete_user(member_user.id)
+        stats = ProjectTaskStatsRepository.get(project.id)
+        assert stats.count(TaskStatus.AWAITING_REASSIGNMENT) == 2
+        assert stats.count(TaskStatus.DONE) == 0
+        
+        TaskRepository.delete(TaskRepository.get_by_id(task.id))
+        assert ProjectTaskStatsRepository.get(project.id).total == 1
+
+
+def test_project_task_stats_rebuild_missing_row(app, manager_user, project_data):
+    with app.app_context():
+        from src.extensions import db
+        from src.task.repository import TaskRepository
+        from src.task.models import Task, ProjectTaskStats
+        from src.task.stats import ProjectTaskStatsRepository
+        
+        project = ProjectService.create_project(manager_user.id, project_data)
+        TaskRepository.create(Task(title="T", description="D", project_id=project.id, status=TaskStatus.DONE))
+        db.session.execute(ProjectTaskStats.__table__.delete())
+        db.session.commit()
+        
+        stats = ProjectTaskStatsRepository.get(project.id)
+        assert stats.total == 1
+        assert stats.is_completed
+        assert db.session.get(ProjectTaskStats, project.id) is not None
+
+
+def test_task_repository_status_counts(app, manager_user, project_data):
+    with app.app_context():
+        from src.task.repository import TaskRepository
+        from src.task.models import Task
+        
+        project = ProjectService.create_project(manager_user.id, project_data)
+        for status in (TaskStatus.DONE, TaskStatus.DONE, TaskStatus.PENDING):
+            TaskRepository.create(Task(title="T", description="D", project_id=project.id, status=status))
+        TaskRepository.delete(TaskRepository.create(Task(title="Gone", description="D", project_id=project.id)))
+        
+        counts = TaskRepository.status_counts(project.id)
+        assert counts.total == 3
+        assert counts.count(TaskStatus.DONE) == 2
+        assert counts.count(TaskStatus.PENDING) == 1
+        assert not counts.is_completed
+
+
+def test_concurrent_project_update_raises_stale_version(app, manager_user, project_data):
+    from sqlalchemy import update
+    from src.extensions import db
+    from src.project.models import Project
+    from src.versioning import StaleVersionError
+    
+    project = ProjectService.create_project(manager_user.id, project_data)
+    assert project.version == 1
+    # Another writer commits in between our read and our write.
+    db.session.execute(update(Project).where(Project.id == project.id).values(version=2), execution_options={"synchronize_session": False})
+    
+    with pytest.raises(StaleVersionError):
+        ProjectService.update_project(project.id, manager_user.id, {"name": "Mine"})
+
@@ -80,6 +80,41 @@ def test_create_task_completed_project(client, manager_user, member_user, manage
     assert resp.status_code == 422
 
 
+def test_create_task_requires_project_access(client, manager_user, member_user, admin_token, manager_token, member_token, task_data):
+    from src.task.models import Task
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "D"}, headers=headers).get_json()["id"]
+    
+    resp = client.post("/api/tasks", json={**task_data, "project_id": project_id}, headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 403
+    resp = client.post("/api/tasks", json={**task_data, "project_id": "missing"}, headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 404
+    assert Task.query.count() == 0
+    
+    resp = client.post("/api/tasks", json={**task_data, "project_id": project_id}, headers={"Authorization": f"Bearer {admin_token}"})
+    assert resp.status_code == 201
+    
+    client.post(f"/api/projects/{project_id}/members", json={"user_id": member_user.id}, headers=headers)
+    resp = client.post("/api/tasks", json={**task_data, "project_id": project_id}, headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 201
+
+
+def test_bulk_create_requires_access_to_every_project(client, manager_user, member_user, manager_token, member_token):
+    from src.task.models import Task
+    own = client.post("/api/projects", json={"name": "Own", "description": "D"}, headers={"Authorization": f"Bearer {manager_token}"}).get_json()["id"]
+    client.post(f"/api/projects/{own}/members", json={"user_id": member_user.id}, headers={"Authorization": f"Bearer {manager_token}"})
+    foreign = client.post("/api/projects", json={"name": "Foreign", "description": "D"}, headers={"Authorization": f"Bearer {manager_token}"}).get_json()["id"]
+    items = [{"title": "T", "description": "D", "project_id": project_id} for project_id in (own, foreign)]
+    
+    resp = client.post("/api/tasks/bulk", json={"tasks": items}, headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 403
+    assert foreign in resp.get_json()["message"]
+    assert Task.query.count() == 0
+    
+    resp = client.post("/api/tasks/bulk", json={"tasks": items[:1]}, headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 201
+
+
 def test_list_tasks_success(client, manager_user, member_user, manager_token):
     resp = client.post(
         "/api/projects",
@@ -106,6 +141,77 @@ def test_list_tasks_success(client, manager_user, member_user, manager_token):
     assert data[0]["title"] == "Task 1"
 
 
+def test_list_tasks_keyset_pages_with_fields_and_filters(client, manager_user, member_user, manager_token):
+    resp = client.post(
+        "/api/projects",
+        json={"name": "Project 1", "description": "Description 1"},
+        headers={"Authorization": f"Bearer {manager_token}"},
+    )
+    project_id = resp.get_json()["id"]
+    for i in range(5):
+        client.post(
+            "/api/tasks",
+            json={"title": f"Task {i}", "description": "Description", "project_id": project_id, "assignee_id": member_user.id if i % 2 else None},
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    
+    titles, cursor = [], None
+    while True:
+        params = {"limit": 2, "fields": "id,title", **({"cursor": cursor} if cursor else {})}
+        body = client.get(f"/api/tasks/project/{project_id}", query_string=params, headers=headers).get_json()
+        assert all(set(item) == {"id", "title"} for item in body["items"])
+        titles.extend(item["title"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert titles == [f"Task {i}" for i in range(5)]
+    
+    resp = client.get(f"/api/tasks/project/{project_id}", query_string={"assignee_id": member_user.id}, headers=headers)
+    assert [t["title"] for t in resp.get_json()] == ["Task 1", "Task 3"]
+    
+    resp = client.get(f"/api/tasks/project/{project_id}", query_string={"status": "done", "limit": 10}, headers=headers)
+    assert resp.get_json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.parametrize("query", ["fields=id,secret", "status=unknown", "cursor=abc", "limit=0"])
+def test_list_tasks_invalid_params(client, manager_user, manager_token, query):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "Description 1"}, headers=headers).get_json()["id"]
+    resp = client.get(f"/api/tasks/project/{project_id}?{query}", headers=headers)
+    assert resp.status_code == 422
+
+
+def test_list_tasks_requires_project_access(client, manager_user, member_user, admin_user, manager_token, member_token, admin_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Project 1", "description": "Description 1"}, headers=headers).get_json()["id"]
+    
+    resp = client.get(f"/api/tasks/project/{project_id}", headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 403
+    
+    resp = client.get(f"/api/tasks/project/{project_id}", headers={"Authorization": f"Bearer {admin_token}"})
+    assert resp.status_code == 200
+    
+    client.post(f"/api/projects/{project_id}/members", json={"user_id": member_user.id}, headers=headers)
+    resp = client.get(f"/api/tasks/project/{project_id}", headers={"Authorization": f"Bearer {member_token}"})
+    assert resp.status_code == 200
+
+
+def test_authorization_decodes_token_once(client, manager_user, manager_token, monkeypatch):
+    import flask_jwt_extended.view_decorators as view_decorators
+    calls = []
+    decode = view_decorators.decode_token
+    monkeypatch.setattr(view_decorators, "decode_token", lambda *a, **kw: calls.append(1) or decode(*a, **kw))
+    
+    resp = client.post(
+        "/api/projects",
+        json={"name": "Project 1", "description": "Description 1"},
+        headers={"Authorization": f"Bearer {manager_token}"},
+    )
+    assert resp.status_code == 201
+    assert len(calls) == 1
+
+
 def test_update_task_status_success(client, manager_user, member_user, manager_token, auth_token):
     from src.task.repository import TaskRepository
     from src.task.models import Task
@@ -138,6 +244,28 @@ def test_update_task_status_success(client, manager_user, member_user, manager_t
     assert data["assignee_id"] == member_user.id
 
 
+def test_update_task_status_if_match_rejects_stale_version(client, manager_user, member_user, manager_token, auth_token):
+    project_id = client.post(
+        "/api/projects", json={"name": "Project 1", "description": "D"}, headers={"Authorization": f"Bearer {manager_token}"}
+    ).get_json()["id"]
+    task = client.post(
+        "/api/tasks",
+        json={"title": "Task 1", "description": "D", "project_id": project_id, "assignee_id": member_user.id},
+        headers={"Authorization": f"Bearer {manager_token}"},
+    ).get_json()
+    headers = {"Authorization": f"Bearer {auth_token(member_user.email, 'pass')}"}
+    
+    resp = client.patch(f"/api/tasks/{task['id']}/status", json={"status": "in_progress"}, headers={**headers, "If-Match": f'"{task["version"]}"'})
+    assert resp.status_code == 200
+    assert resp.get_json()["version"] == task["version"] + 1
+    
+    resp = client.patch(f"/api/tasks/{task['id']}/status", json={"status": "done"}, headers={**headers, "If-Match": f'"{task["version"]}"'})
+    assert resp.status_code == 412
+    
+    resp = client.patch(f"/api/tasks/{task['id']}/status", json={"status": "done"}, headers=headers)
+    assert resp.status_code == 200
+
+
 def test_update_task_status_forbidden_not_assignee(client, manager_user, member_user, manager_token, auth_token):
     from src.task.repository import TaskRepository
     from src.task.models import Task
@@ -224,6 +352,11 @@ def test_project_auto_completes_when_all_tasks_done(client, manager_user, member
         headers={"Authorization": f"Bearer {manager_token}"},
     )
     project_id = resp.get_json()["id"]
+    client.post(
+        f"/api/projects/{project_id}/members",
+        json={"user_id": member_user.id},
+        headers={"Authorization": f"Bearer {manager_token}"},
+    )
     
     task1 = Task(
         title="Task 1",
@@ -440,3 +573,85 @@ def test_reassign_task_invalid_assignee_not_project_member(client, manager_user,
         headers={"Authorization": f"Bearer {manager_token}"},
     )
     assert resp.status_code == 422
+
+
+def test_bulk_create_and_status_update(client, manager_user, member_user, manager_token, auth_token):
+    from src.log.models import Log, ActionType
+    from src.task.stats import ProjectTaskStatsRepository
+    
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Plan", "description": "D"}, headers=headers).get_json()["id"]
+    items = [{"title": f"Task {i}", "description": "D", "project_id": project_id, "assignee_id": member_user.id} for i in range(3)]
+    
+    resp = client.post("/api/tasks/bulk", json={"tasks": items}, headers=headers)
+    
+    assert resp.status_code == 201
+    tasks = resp.get_json()
+    assert [t["title"] for t in tasks] == ["Task 0", "Task 1", "Task 2"]
+    assert ProjectTaskStatsRepository.get(project_id).total == 3
+    created_logs = Log.query.filter_by(action=ActionType.TASK_CREATED).all()
+    assert len(created_logs) == 1
+    assert '"count": 3' in created_logs[0].details
+    
+    member_headers = {"Authorization": f"Bearer {auth_token(member_user.email, 'pass')}"}
+    resp = client.patch(
+        "/api/tasks/bulk/status",
+        json={"tasks": [{"id": t["id"], "status": "done", "version": t["version"]} for t in tasks]},
+        headers=member_headers,
+    )
+    
+    assert resp.status_code == 200
+    assert {t["status"] for t in resp.get_json()} == {"done"}
+    assert client.get(f"/api/projects/{project_id}", headers=headers).get_json()["status"] == ProjectStatus.COMPLETED.value
+    assert Log.query.filter_by(action=ActionType.TASK_UPDATED).count() == 1
+
+
+def test_bulk_status_update_is_all_or_nothing(client, manager_user, member_user, manager_token, auth_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    project_id = client.post("/api/projects", json={"name": "Plan", "description": "D"}, headers=headers).get_json()["id"]
+    tasks = client.post(
+        "/api/tasks/bulk",
+        json={"tasks": [
+            {"title": "Mine", "description": "D", "project_id": project_id, "assignee_id": member_user.id},
+            {"title": "Theirs", "description": "D", "project_id": project_id, "assignee_id": manager_user.id},
+        ]},
+        headers=headers,
+    ).get_json()
+    
+    resp = client.patch(
+        "/api/tasks/bulk/status",
+        json={"tasks": [{"id": t["id"], "status": "in_progress"} for t in tasks]},
+        headers={"Authorization": f"Bearer {auth_token(member_user.email, 'pass')}"},
+    )
+    
+    assert resp.status_code == 403
+    statuses = {t["status"] for t in client.get(f"/api/tasks/project/{project_id}", headers=headers).get_json()}
+    assert statuses == {TaskStatus.PENDING.value}
+
+
+@pytest.mark.parametrize("payload,status_code", [
+    ({"tasks": []}, 422),
+    ({"tasks": [{"title": "T", "project_id": "p"}]}, 422),
+    ({"tasks": [{"title": "T", "description": "D", "project_id": "missing"}]}, 404),
+    ({"tasks": [{"title": "T", "description": "D", "project_id": ["p1"]}]}, 422),
+    ({"tasks": [{"title": "T", "description": "D", "project_id": "p1", "assignee_id": 7}]}, 422),
+])
+def test_bulk_create_validates_before_writing(client, manager_token, payload, status_code):
+    resp = client.post("/api/tasks/bulk", json=payload, headers={"Authorization": f"Bearer {manager_token}"})
+    assert resp.status_code == status_code
+
+
+def test_bulk_status_update_rejects_non_integer_version(client, manager_user, member_user, auth_token):
+    resp = client.patch(
+        "/api/tasks/bulk/status",
+        json={"tasks": [{"id": "t1", "status": "done", "version": "3"}]},
+        headers={"Authorization": f"Bearer {auth_token(member_user.email, 'pass')}"},
+    )
+    assert resp.status_code == 422
+    
+    resp = client.patch(
+        "/api/tasks/bulk/status",
+        json={"tasks": [{"id": {"nested": 1}, "status": "done"}]},
+        headers={"Authorization": f"Bearer {auth_token(member_user.email, 'pass')}"},
+    )
+    assert resp.status_code == 422
@@ -7,7 +7,7 @@ src_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.pa
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from state.auth_state import get_token
+from state.auth_state import get_token, get_etag_cache
 from config import API_TIMEOUT
 
 class APIClient:
@@ -23,11 +23,23 @@ class APIClient:
         return headers
 
     def get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        headers = self._get_headers()
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        etag_cache = get_etag_cache()
+        cached = etag_cache.get(cache_key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
         response = requests.get(
-            url, headers=self._get_headers(), params=params, timeout=self.timeout
+            url, headers=headers, params=params, timeout=self.timeout
         )
+        if response.status_code == 304 and cached:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_cache[cache_key] = (etag, data)
+        return data
 
     def post(self, url: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         response = requests.post(
@@ -8,5 +8,6 @@ from state.auth_state import (
     is_authenticated,
     logout,
     get_user_role,
+    get_etag_cache,
 )
 
@@ -3,6 +3,7 @@ import streamlit as st
 TOKEN_KEY = "access_token"
 REFRESH_TOKEN_KEY = "refresh_token"
 USER_KEY = "user"
+ETAG_CACHE_KEY = "etag_cache"
 
 def get_token():
     if TOKEN_KEY not in st.session_state:
@@ -43,6 +44,13 @@ def logout():
         del st.session_state[REFRESH_TOKEN_KEY]
     if USER_KEY in st.session_state:
         del st.session_state[USER_KEY]
+    if ETAG_CACHE_KEY in st.session_state:
+        del st.session_state[ETAG_CACHE_KEY]
+
+def get_etag_cache():
+    if ETAG_CACHE_KEY not in st.session_state:
+        st.session_state[ETAG_CACHE_KEY] = {}
+    return st.session_state[ETAG_CACHE_KEY]
 
 def get_user_role():
     user = get_user()